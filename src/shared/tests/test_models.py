@@ -3,14 +3,26 @@ Tests for shared models.
 This module contains tests for Address, Contact and TimestampedModel.
 """
 
-import time
+from datetime import timedelta
+from unittest.mock import patch
 
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.utils import timezone
 
 from src.shared.models import Address, Contact
 
+VALID_ADDRESS_DATA = {
+    "street": "Rua das Flores, 123",
+    "city": "São Paulo",
+    "state": "SP",
+    "neighbourhood": "Centro",
+    "number": 123,
+    "postal_code": "01234567",
+    "complement": "Apto 45",
+}
+VALID_CONTACT_DATA = {"email": "teste@exemplo.com", "phone": "11999999999"}
+
 
 class TestTimestampedModel(TestCase):
     """
@@ -36,41 +48,31 @@ class TestTimestampedModel(TestCase):
 
     def test_updated_at_auto_now(self):
         """Test that updated_at is automatically updated on save."""
-        address = Address.objects.create(
-            street="Rua Teste",
-            city="São Paulo",
-            state="SP",
-            number=123,
-            postal_code="01234567",
-        )
-        original_updated_at = address.updated_at
-
-        time.sleep(0.01)
+        created_at = timezone.now()
+        saved_at = created_at + timedelta(seconds=1)
+        with patch("django.utils.timezone.now", return_value=created_at):
+            address = Address.objects.create(
+                street="Rua Teste",
+                city="São Paulo",
+                state="SP",
+                number=123,
+                postal_code="01234567",
+            )
 
         address.street = "Rua Atualizada"
-        address.save()
+        with patch("django.utils.timezone.now", return_value=saved_at):
+            address.save()
 
-        self.assertGreater(address.updated_at, original_updated_at)
+        self.assertEqual(address.created_at, created_at)
+        self.assertEqual(address.updated_at, saved_at)
 
 
 class TestAddressModel(TestCase):
     """Test cases for Address model."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.valid_address_data = {
-            "street": "Rua das Flores, 123",
-            "city": "São Paulo",
-            "state": "SP",
-            "neighbourhood": "Centro",
-            "number": 123,
-            "postal_code": "01234567",
-            "complement": "Apto 45",
-        }
-
     def test_create_address_with_all_fields(self):
         """Test creating an address with all fields."""
-        address = Address.objects.create(**self.valid_address_data)
+        address = Address.objects.create(**VALID_ADDRESS_DATA)
 
         self.assertEqual(address.street, "Rua das Flores, 123")
         self.assertEqual(address.city, "São Paulo")
@@ -102,32 +104,6 @@ class TestAddressModel(TestCase):
         self.assertEqual(address.neighbourhood, "")  # Should be empty
         self.assertEqual(address.complement, "")  # Should be empty
 
-    def test_address_str_representation(self):
-        """Test the string representation of Address."""
-        address = Address.objects.create(**self.valid_address_data)
-        expected_str = "Rua das Flores, 123, São Paulo/SP - 01234567"
-
-        self.assertEqual(str(address), expected_str)
-
-    def test_address_meta_options(self):
-        """Test Address model meta options."""
-        self.assertEqual(Address._meta.db_table, "address")
-        self.assertEqual(Address._meta.verbose_name, "Endereço")
-        self.assertEqual(Address._meta.verbose_name_plural, "Endereços")
-
-    def test_address_field_max_lengths(self):
-        """Test field maximum lengths."""
-        long_street = "x" * 256  # Exceeds max_length of 255
-        with self.assertRaises(ValidationError):
-            address = Address(
-                street=long_street,
-                city="São Paulo",
-                state="SP",
-                number=123,
-                postal_code="01234567",
-            )
-            address.full_clean()
-
     def test_postal_code_length(self):
         """Test postal code field length."""
         address = Address.objects.create(
@@ -143,13 +119,9 @@ class TestAddressModel(TestCase):
 class TestContactModel(TestCase):
     """Test cases for Contact model."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.valid_contact_data = {"email": "teste@exemplo.com", "phone": "11999999999"}
-
     def test_create_contact_with_all_fields(self):
         """Test creating a contact with all fields."""
-        contact = Contact.objects.create(**self.valid_contact_data)
+        contact = Contact.objects.create(**VALID_CONTACT_DATA)
 
         self.assertEqual(contact.email, "teste@exemplo.com")
         self.assertEqual(contact.phone, "11999999999")
@@ -177,13 +149,6 @@ class TestContactModel(TestCase):
         self.assertEqual(contact.email, "")
         self.assertEqual(contact.phone, "")
 
-    def test_contact_str_representation(self):
-        """Test the string representation of Contact."""
-        contact = Contact.objects.create(**self.valid_contact_data)
-        expected_str = "teste@exemplo.com / 11999999999"
-
-        self.assertEqual(str(contact), expected_str)
-
     def test_email_allows_duplicates(self):
         """Test that email field allows duplicates (unique constraint removed for supplier updates)."""
         contact1 = Contact.objects.create(
@@ -205,11 +170,55 @@ class TestContactModel(TestCase):
         self.assertEqual(contact1.email, "")
         self.assertEqual(contact2.email, "")
 
-    def test_contact_meta_options(self):
-        """Test Contact model meta options."""
-        self.assertEqual(Contact._meta.db_table, "contact")
-        self.assertEqual(Contact._meta.verbose_name, "Contato")
-        self.assertEqual(Contact._meta.verbose_name_plural, "Contatos")
+    def test_duplicate_empty_emails_allowed(self):
+        """Test that multiple contacts with empty email are allowed."""
+        contact1 = Contact.objects.create(email="", phone="11111111111")
+        contact2 = Contact.objects.create(email="", phone="11222222222")
+
+        self.assertEqual(contact1.email, "")
+        self.assertEqual(contact2.email, "")
+        self.assertNotEqual(contact1.pk, contact2.pk)
+
+
+class TestModelStrRepresentations(SimpleTestCase):
+    """String representation tests on unsaved instances; no database access."""
+
+    def test_address_str_representation(self):
+        """Test the string representation of Address."""
+        address = Address(
+            street="Rua das Flores, 123",
+            city="São Paulo",
+            state="SP",
+            number=123,
+            postal_code="01234567",
+        )
+        expected_str = "Rua das Flores, 123, São Paulo/SP - 01234567"
+
+        self.assertEqual(str(address), expected_str)
+
+    def test_contact_str_representation(self):
+        """Test the string representation of Contact."""
+        contact = Contact(email="teste@exemplo.com", phone="11999999999")
+        expected_str = "teste@exemplo.com / 11999999999"
+
+        self.assertEqual(str(contact), expected_str)
+
+
+class TestModelValidation(SimpleTestCase):
+    """Field validation tests; full_clean() on unsaved instances runs no queries."""
+
+    def test_address_field_max_lengths(self):
+        """Test field maximum lengths."""
+        long_street = "x" * 256  # Exceeds max_length of 255
+        with self.assertRaises(ValidationError):
+            address = Address(
+                street=long_street,
+                city="São Paulo",
+                state="SP",
+                number=123,
+                postal_code="01234567",
+            )
+            address.full_clean()
 
     def test_phone_max_length(self):
         """Test phone field maximum length."""
@@ -224,11 +233,37 @@ class TestContactModel(TestCase):
             contact = Contact(email="email-invalido", phone="11999999999")
             contact.full_clean()
 
-    def test_duplicate_empty_emails_allowed(self):
-        """Test that multiple contacts with empty email are allowed."""
-        contact1 = Contact.objects.create(email="", phone="11111111111")
-        contact2 = Contact.objects.create(email="", phone="11222222222")
 
-        self.assertEqual(contact1.email, "")
-        self.assertEqual(contact2.email, "")
-        self.assertNotEqual(contact1.pk, contact2.pk)
+def _meta_options(model) -> dict:
+    """Return the Meta options the tests pin, with lazy labels resolved."""
+    return {
+        "db_table": model._meta.db_table,
+        "verbose_name": str(model._meta.verbose_name),
+        "verbose_name_plural": str(model._meta.verbose_name_plural),
+    }
+
+
+class TestModelMetaOptions(SimpleTestCase):
+    """Meta options read straight from the model classes."""
+
+    def test_address_meta_options(self):
+        """Test Address model meta options."""
+        self.assertEqual(
+            _meta_options(Address),
+            {
+                "db_table": "address",
+                "verbose_name": "Endereço",
+                "verbose_name_plural": "Endereços",
+            },
+        )
+
+    def test_contact_meta_options(self):
+        """Test Contact model meta options."""
+        self.assertEqual(
+            _meta_options(Contact),
+            {
+                "db_table": "contact",
+                "verbose_name": "Contato",
+                "verbose_name_plural": "Contatos",
+            },
+        )
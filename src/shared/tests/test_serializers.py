@@ -5,14 +5,23 @@ This module contains tests for BaseSerializer, AddressSerializer, and ContactSer
 
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from rest_framework import serializers
 
 from src.shared.models import Address, Contact
 from src.shared.serializers import AddressSerializer, BaseSerializer, ContactSerializer
 
+# Flat payloads: serializers never mutate their input, and per-test variants
+# are built with a dict spread.
+VALID_ADDRESS_DATA = {
+    "postal_code": "01310100",  # CEP válido de São Paulo
+    "number": 123,
+    "complement": "Apto 45",
+}
+VALID_CONTACT_DATA = {"email": "teste@exemplo.com", "phone": "11999999999"}
 
-class TestBaseSerializer(TestCase):
+
+class TestBaseSerializer(SimpleTestCase):
     """Test cases for BaseSerializer."""
 
     def test_meta_fields_all(self):
@@ -34,16 +43,20 @@ class TestBaseSerializer(TestCase):
         self.assertTrue(issubclass(BaseSerializer, serializers.ModelSerializer))
 
 
-class TestAddressSerializer(TestCase):
-    """Test cases for AddressSerializer."""
+class TestAddressSerializer(SimpleTestCase):
+    """Test cases for AddressSerializer validation; the CEP lookup is mocked."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Patch the CEP lookup used by AddressSerializer once per class."""
+        super().setUpClass()
+        cls.mock_get_address = cls.enterClassContext(
+            patch("src.shared.serializers.get_address_from_cep")
+        )
 
     def setUp(self):
-        """Set up test data."""
-        self.valid_address_data = {
-            "postal_code": "01310100",  # CEP válido de São Paulo
-            "number": 123,
-            "complement": "Apto 45",
-        }
+        """Clear the return value and side effect left by the previous test."""
+        self.mock_get_address.reset_mock(return_value=True, side_effect=True)
 
     def test_inheritance_from_base_serializer(self):
         """Test that AddressSerializer inherits from BaseSerializer."""
@@ -71,17 +84,16 @@ class TestAddressSerializer(TestCase):
         """Test that Meta.read_only_fields contains id."""
         self.assertEqual(AddressSerializer.Meta.read_only_fields, ("id",))
 
-    @patch("src.shared.serializers.get_address_from_cep")
-    def test_validate_with_valid_postal_code(self, mock_get_address):
+    def test_validate_with_valid_postal_code(self):
         """Test validation with valid postal code."""
-        mock_get_address.return_value = {
+        self.mock_get_address.return_value = {
             "street": "Avenida Paulista",
             "district": "Bela Vista",
             "city": "São Paulo",
             "uf": "SP",
         }
 
-        serializer = AddressSerializer(data=self.valid_address_data)
+        serializer = AddressSerializer(data=VALID_ADDRESS_DATA)
         self.assertTrue(serializer.is_valid())
 
         self.assertIn("street", serializer.validated_data)
@@ -89,49 +101,48 @@ class TestAddressSerializer(TestCase):
         self.assertIn("city", serializer.validated_data)
         self.assertIn("state", serializer.validated_data)
 
-    @patch("src.shared.serializers.get_address_from_cep")
-    def test_validate_with_invalid_postal_code_format(self, mock_get_address):
+    def test_validate_with_invalid_postal_code_format(self):
         """Test validation with invalid postal code format."""
         from brazilcep.exceptions import InvalidCEP
 
-        mock_get_address.side_effect = InvalidCEP("Invalid CEP format")
+        self.mock_get_address.side_effect = InvalidCEP("Invalid CEP format")
 
-        invalid_data = self.valid_address_data.copy()
-        invalid_data["postal_code"] = "invalid"
+        invalid_data = {**VALID_ADDRESS_DATA, "postal_code": "invalid"}
 
         serializer = AddressSerializer(data=invalid_data)
         self.assertFalse(serializer.is_valid())
         self.assertIn("field", serializer.errors)
 
-    @patch("src.shared.serializers.get_address_from_cep")
-    def test_validate_with_postal_code_not_found(self, mock_get_address):
+    def test_validate_with_postal_code_not_found(self):
         """Test validation with postal code not found."""
         from brazilcep.exceptions import CEPNotFound
 
-        mock_get_address.side_effect = CEPNotFound("CEP not found")
+        self.mock_get_address.side_effect = CEPNotFound("CEP not found")
 
-        invalid_data = self.valid_address_data.copy()
-        invalid_data["postal_code"] = "99999999"
+        invalid_data = {**VALID_ADDRESS_DATA, "postal_code": "99999999"}
 
         serializer = AddressSerializer(data=invalid_data)
         self.assertFalse(serializer.is_valid())
         self.assertIn("field", serializer.errors)
 
-    @patch("src.shared.serializers.get_address_from_cep")
-    def test_validate_with_connection_error(self, mock_get_address):
+    def test_validate_with_connection_error(self):
         """Test validation when all CEP services fail."""
         from brazilcep.exceptions import BrazilCEPException, ConnectionError
 
-        mock_get_address.side_effect = [
+        self.mock_get_address.side_effect = [
             ConnectionError("Service 1 failed"),
             BrazilCEPException("Service 2 failed"),
             ConnectionError("Service 3 failed"),
         ]
 
-        serializer = AddressSerializer(data=self.valid_address_data)
+        serializer = AddressSerializer(data=VALID_ADDRESS_DATA)
         self.assertFalse(serializer.is_valid())
         self.assertIn("field", serializer.errors)
 
+
+class TestAddressSerializerCreate(TestCase):
+    """Test cases for saving an Address through AddressSerializer."""
+
     def test_create_address(self):
         """Test creating an address through serializer."""
         with patch("src.shared.serializers.get_address_from_cep") as mock_get_address:
@@ -141,25 +152,20 @@ class TestAddressSerializer(TestCase):
                 "city": "São Paulo",
                 "uf": "SP",
             }
-
-            serializer = AddressSerializer(data=self.valid_address_data)
+            serializer = AddressSerializer(data=VALID_ADDRESS_DATA)
             self.assertTrue(serializer.is_valid())
 
-            address = serializer.save()
-            self.assertIsInstance(address, Address)
-            self.assertEqual(address.postal_code, "01310100")
-            self.assertEqual(address.number, 123)
-            self.assertEqual(address.complement, "Apto 45")
-            self.assertEqual(address.street, "Rua Teste")
+        address = serializer.save()
+        self.assertIsInstance(address, Address)
+        self.assertEqual(address.postal_code, "01310100")
+        self.assertEqual(address.number, 123)
+        self.assertEqual(address.complement, "Apto 45")
+        self.assertEqual(address.street, "Rua Teste")
 
 
 class TestContactSerializer(TestCase):
     """Test cases for ContactSerializer."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.valid_contact_data = {"email": "teste@exemplo.com", "phone": "11999999999"}
-
     def test_inheritance_from_base_serializer(self):
         """Test that ContactSerializer inherits from BaseSerializer."""
         self.assertTrue(issubclass(ContactSerializer, BaseSerializer))
@@ -181,17 +187,11 @@ class TestContactSerializer(TestCase):
 
     def test_validate_with_valid_data(self):
         """Test validation with valid contact data."""
-        serializer = ContactSerializer(data=self.valid_contact_data)
+        serializer = ContactSerializer(data=VALID_CONTACT_DATA)
         self.assertTrue(serializer.is_valid())
 
         self.assertIsNotNone(serializer.validated_data)
 
-    def test_validate_with_empty_email(self):
-        """Test validation with empty email."""
-        data = {"phone": "11999999999"}
-        serializer = ContactSerializer(data=data)
-        self.assertTrue(serializer.is_valid())
-
     def test_validate_with_empty_phone(self):
         """Test validation with empty phone."""
         data = {"email": "teste@exemplo.com"}
@@ -230,20 +230,9 @@ class TestContactSerializer(TestCase):
         self.assertFalse(serializer.is_valid())
         self.assertIn("email", serializer.errors)
 
-    @patch("rest_framework.serializers.EmailField.run_validation")
-    def test_validate_with_invalid_email_format(self, mock_email_validation):
-        """Test validation with invalid email format."""
-        mock_email_validation.side_effect = serializers.ValidationError("Invalid email")
-
-        data = {"email": "email-invalido", "phone": "11999999999"}
-        serializer = ContactSerializer(data=data)
-
-        self.assertFalse(serializer.is_valid())
-        self.assertIn("email", serializer.errors)
-
     def test_create_contact(self):
         """Test creating a contact through serializer."""
-        serializer = ContactSerializer(data=self.valid_contact_data)
+        serializer = ContactSerializer(data=VALID_CONTACT_DATA)
         self.assertTrue(serializer.is_valid())
 
         contact = serializer.save()
@@ -261,3 +250,24 @@ class TestContactSerializer(TestCase):
 
         updated_contact = serializer.save()
         self.assertIsInstance(updated_contact, Contact)
+
+
+class TestContactSerializerValidation(SimpleTestCase):
+    """ContactSerializer checks that return before the email uniqueness query."""
+
+    def test_validate_with_empty_email(self):
+        """Test validation with empty email."""
+        data = {"phone": "11999999999"}
+        serializer = ContactSerializer(data=data)
+        self.assertTrue(serializer.is_valid())
+
+    @patch("rest_framework.serializers.EmailField.run_validation")
+    def test_validate_with_invalid_email_format(self, mock_email_validation):
+        """Test validation with invalid email format."""
+        mock_email_validation.side_effect = serializers.ValidationError("Invalid email")
+
+        data = {"email": "email-invalido", "phone": "11999999999"}
+        serializer = ContactSerializer(data=data)
+
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("email", serializer.errors)
@@ -5,7 +5,7 @@ This module contains tests for BaseAPIView and related view components.
 
 from unittest.mock import Mock
 
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from rest_framework import serializers, status
 from rest_framework.response import Response
 from rest_framework.test import APIRequestFactory
@@ -100,15 +100,8 @@ class DummyViewWithInOut(BaseAPIView):
         return Response(return_data, status=status.HTTP_201_CREATED)
 
 
-class TestBaseAPIView(TestCase):
-    """Test cases for BaseAPIView."""
-
-    def setUp(self):
-        """Set up test data."""
-        self.factory = APIRequestFactory()
-        self.contact = Contact.objects.create(
-            email="test@example.com", phone="11999999999"
-        )
+class TestBaseAPIViewSerializerResolution(SimpleTestCase):
+    """Test cases for BaseAPIView serializer class resolution."""
 
     def test_get_serializer_class_with_single_serializer(self):
         """Test get_serializer_class with only serializer_class."""
@@ -155,6 +148,74 @@ class TestBaseAPIView(TestCase):
         view_single = DummyView()
         self.assertEqual(view_single.get_out_serializer_class(), DummySerializer)
 
+    def test_method_routing(self):
+        """Test that different HTTP methods use appropriate serializers."""
+        view = DummyViewWithInOut()
+
+        view.request = Mock()
+        view.request.method = "POST"
+        self.assertEqual(view.get_serializer_class(), DummyInSerializer)
+
+        view.request.method = "PUT"
+        self.assertEqual(view.get_serializer_class(), DummyInSerializer)
+
+        view.request.method = "PATCH"
+        self.assertEqual(view.get_serializer_class(), DummyInSerializer)
+
+        view.request.method = "GET"
+        self.assertEqual(view.get_serializer_class(), DummyOutSerializer)
+
+        view.request.method = "HEAD"
+        self.assertEqual(view.get_serializer_class(), DummyOutSerializer)
+
+        view.request.method = "OPTIONS"
+        self.assertEqual(view.get_serializer_class(), DummyOutSerializer)
+
+    def test_serializer_class_priority(self):
+        """Test serializer class priority when multiple are defined."""
+
+        class ViewWithAll(BaseAPIView):
+            serializer_class = DummySerializer
+            serializer_class_in = DummyInSerializer
+            serializer_class_out = DummyOutSerializer
+
+        view = ViewWithAll()
+        view.request = Mock()
+
+        view.request.method = "POST"
+        self.assertEqual(view.get_serializer_class(), DummyInSerializer)
+
+        view.request.method = "GET"
+        self.assertEqual(view.get_serializer_class(), DummyOutSerializer)
+
+    def test_fallback_to_serializer_class(self):
+        """Test fallback to serializer_class when in/out not defined."""
+
+        class ViewWithOnlyBase(BaseAPIView):
+            serializer_class = DummySerializer
+
+        view = ViewWithOnlyBase()
+        view.request = Mock()
+
+        for method in ["GET", "POST", "PUT", "PATCH", "DELETE"]:
+            view.request.method = method
+            self.assertEqual(view.get_serializer_class(), DummySerializer)
+
+
+class TestBaseAPIView(TestCase):
+    """Test cases for BaseAPIView."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
+        cls.contact = Contact.objects.create(
+            email="test@example.com", phone="11999999999"
+        )
+
+    def setUp(self):
+        """Set up the request factory."""
+        self.factory = APIRequestFactory()
+
     def test_get_request(self):
         """Test GET request handling."""
         view = DummyView()
@@ -233,56 +294,3 @@ class TestBaseAPIView(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertIn("created_at", response.data)
-
-    def test_method_routing(self):
-        """Test that different HTTP methods use appropriate serializers."""
-        view = DummyViewWithInOut()
-
-        view.request = Mock()
-        view.request.method = "POST"
-        self.assertEqual(view.get_serializer_class(), DummyInSerializer)
-
-        view.request.method = "PUT"
-        self.assertEqual(view.get_serializer_class(), DummyInSerializer)
-
-        view.request.method = "PATCH"
-        self.assertEqual(view.get_serializer_class(), DummyInSerializer)
-
-        view.request.method = "GET"
-        self.assertEqual(view.get_serializer_class(), DummyOutSerializer)
-
-        view.request.method = "HEAD"
-        self.assertEqual(view.get_serializer_class(), DummyOutSerializer)
-
-        view.request.method = "OPTIONS"
-        self.assertEqual(view.get_serializer_class(), DummyOutSerializer)
-
-    def test_serializer_class_priority(self):
-        """Test serializer class priority when multiple are defined."""
-
-        class ViewWithAll(BaseAPIView):
-            serializer_class = DummySerializer
-            serializer_class_in = DummyInSerializer
-            serializer_class_out = DummyOutSerializer
-
-        view = ViewWithAll()
-        view.request = Mock()
-
-        view.request.method = "POST"
-        self.assertEqual(view.get_serializer_class(), DummyInSerializer)
-
-        view.request.method = "GET"
-        self.assertEqual(view.get_serializer_class(), DummyOutSerializer)
-
-    def test_fallback_to_serializer_class(self):
-        """Test fallback to serializer_class when in/out not defined."""
-
-        class ViewWithOnlyBase(BaseAPIView):
-            serializer_class = DummySerializer
-
-        view = ViewWithOnlyBase()
-        view.request = Mock()
-
-        for method in ["GET", "POST", "PUT", "PATCH", "DELETE"]:
-            view.request.method = method
-            self.assertEqual(view.get_serializer_class(), DummySerializer)
@@ -121,7 +121,9 @@ class SupplierEvaluation(TimestampedModel):
     def calculate_final_score(self):
         """Calculate the final weighted score for this evaluation."""
         criterion_scores = (
-            self.criterion_scores.all() if hasattr(self, "pk") and self.pk else []
+            self.criterion_scores.select_related("criterion")
+            if hasattr(self, "pk") and self.pk
+            else []
         )
 
         if not criterion_scores:
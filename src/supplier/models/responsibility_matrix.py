@@ -9,14 +9,14 @@ from src.shared.models import TimestampedModel
 from src.supplier.models.supplier import Supplier
 
 # Choices reutilizáveis para todos os campos da matriz RACI (definidas fora da classe)
-RACI_CHOICES = [
+RACI_CHOICES = (
     ("A", "A - Accountable (Responsável)"),
     ("R", "R - Responsible (Executa)"),
     ("C", "C - Consulted (Consultado)"),
     ("I", "I - Informed (Informado)"),
     ("-", "- Não Envolvido"),
     ("A/R", "A/R - Responsável e Executa"),
-]
+)
 
 # Labels das áreas/responsáveis (definidas fora da classe)
 AREA_SOLICITANTE = "Área Solicitante"
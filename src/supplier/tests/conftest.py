@@ -3,15 +3,104 @@ Fixtures para os testes do fluxo de aprovação de fornecedores.
 """
 
 import pytest
+from django.conf import settings
+from django.test import TestCase, TransactionTestCase, override_settings
 from django.utils import timezone
 from model_bakery import baker
 from rest_framework.test import APIClient
 
 from src.supplier.enums import DomPendecyTypeEnum
 from src.supplier.models.approval_workflow import ApprovalFlow, ApprovalStep, Approver
-from src.supplier.models.domain import DomPendencyType, DomSupplierSituation
+from src.supplier.models.domain import (
+    DomBusinessSector,
+    DomCategory,
+    DomClassification,
+    DomCompanySize,
+    DomCustomerType,
+    DomIcmsTaxpayer,
+    DomIncomeType,
+    DomIssRegime,
+    DomIssWithholding,
+    DomPayerType,
+    DomPaymentMethod,
+    DomPendencyType,
+    DomPixType,
+    DomPublicEntity,
+    DomRiskLevel,
+    DomSupplierSituation,
+    DomTaxationMethod,
+    DomTaxationRegime,
+    DomTaxpayerClassification,
+    DomTypeSupplier,
+    DomWithholdingTax,
+)
 from src.supplier.models.supplier import Supplier
 
+IN_MEMORY_STORAGE = "django.core.files.storage.InMemoryStorage"
+
+# Linhas de domínio de referência compartilhadas pela sessão de testes.
+# Os nomes não podem colidir com registros criados pelos próprios testes.
+DOMAIN_SEED = {
+    DomPaymentMethod: ("TED",),
+    DomPixType: ("Email",),
+    DomPayerType: ("PJ",),
+    DomBusinessSector: ("Tecnologia da Informação",),
+    DomTaxpayerClassification: ("Normal",),
+    DomPublicEntity: ("RFB",),
+    DomIssWithholding: ("No",),
+    DomIssRegime: ("Normal",),
+    DomWithholdingTax: ("IRRF",),
+    DomCompanySize: ("Small",),
+    DomIcmsTaxpayer: ("No",),
+    DomTaxationRegime: ("Simple",),
+    DomIncomeType: ("Services",),
+    DomTaxationMethod: ("Normal",),
+    DomCustomerType: ("B2B",),
+    DomClassification: ("Test",),
+    DomCategory: ("Services",),
+    DomRiskLevel: ("Low",),
+    DomTypeSupplier: ("Legal",),
+}
+
+
+# Cache de `domain_rows`, atualizado no lugar quando um flush recria as linhas.
+_DOMAIN_ROWS = {}
+
+
+def _seed_domain_rows() -> dict:
+    """Popula as tabelas de domínio de referência e retorna `{Model: {name: instância}}`."""
+    rows = {}
+    for model, names in DOMAIN_SEED.items():
+        model.objects.bulk_create(
+            [model(name=name) for name in names], ignore_conflicts=True
+        )
+        rows[model] = {
+            instance.name: instance for instance in model.objects.filter(name__in=names)
+        }
+    return rows
+
+
+@pytest.fixture(scope="session")
+def domain_rows(reference_rows):
+    """
+    Fixture para expor as linhas de domínio de referência já populadas na sessão.
+
+    Retorna `{Model: {name: instância}}`; as linhas são criadas por `reference_rows`.
+    """
+    return _DOMAIN_ROWS
+
+
+@pytest.fixture(autouse=True, scope="class")
+def class_domain_rows(request):
+    """
+    Fixture para expor `domain_rows` como `cls.domain_rows` às classes de teste.
+
+    Só atende classes com `uses_domain_rows = True`; roda antes do `setUpTestData`.
+    """
+    if not getattr(request.cls, "uses_domain_rows", False):
+        return
+    request.cls.domain_rows = request.getfixturevalue("domain_rows")
+
 
 @pytest.fixture
 def api_client():
@@ -51,57 +140,116 @@ def basic_approval_flow(supplier, approval_step):
 
 
 @pytest.fixture(autouse=True)
-def setup_supplier_situation():
-    """Fixture para garantir que exista pelo menos uma situação de fornecedor."""
+def isolated_storage(request):
+    """
+    Fixture para isolar o storage dos testes marcados com `usesstorage`.
+
+    Os arquivos vão para um `InMemoryStorage` descartado ao fim do teste, sem
+    gravar em disco; testes sem o marcador não alteram o storage.
+    """
+    if request.node.get_closest_marker("usesstorage") is None:
+        yield
+        return
+
+    storages = {**settings.STORAGES, "default": {"BACKEND": IN_MEMORY_STORAGE}}
+    with override_settings(STORAGES=storages):
+        yield
+
+
+def _seed_supplier_situation() -> None:
+    """Cria os tipos de pendência e as situações de fornecedor, se ainda não existirem."""
+    DomPendencyType.objects.bulk_create(
+        [
+            DomPendencyType(
+                id=DomPendecyTypeEnum.PENDENCIA_CADASTRO.value,
+                name="PENDÊNCIA DE CADASTRO",
+            ),
+            DomPendencyType(
+                id=DomPendecyTypeEnum.PENDENCIA_DOCUMENTACAO.value,
+                name="PENDÊNCIA DE DOCUMENTAÇÃO",
+            ),
+            DomPendencyType(
+                id=DomPendecyTypeEnum.PENDENCIA_MATRIZ_RESPONSABILIDADE.value,
+                name="PENDÊNCIA MATRIZ DE RESPONSABILIDADE",
+            ),
+            DomPendencyType(
+                id=DomPendecyTypeEnum.PENDENCIA_AVALIACAO.value,
+                name="PENDÊNCIA DE AVALIAÇÃO",
+            ),
+        ],
+        ignore_conflicts=True,
+    )
+    situations = [("ATIVO", None)] + [
+        ("PENDENTE", pendency.value)
+        for pendency in (
+            DomPendecyTypeEnum.PENDENCIA_MATRIZ_RESPONSABILIDADE,
+            DomPendecyTypeEnum.PENDENCIA_DOCUMENTACAO,
+            DomPendecyTypeEnum.PENDENCIA_CADASTRO,
+            DomPendecyTypeEnum.PENDENCIA_AVALIACAO,
+        )
+    ]
+    # ATIVO tem pendency_type nulo, que o unique_together não protege; por isso
+    # as situações faltantes são filtradas por (name, pendency_type) em vez de
+    # depender de ignore_conflicts.
+    existing = set(DomSupplierSituation.objects.values_list("name", "pendency_type_id"))
+    DomSupplierSituation.objects.bulk_create(
+        [
+            DomSupplierSituation(name=name, pendency_type_id=pendency_type_id)
+            for name, pendency_type_id in situations
+            if (name, pendency_type_id) not in existing
+        ]
+    )
+
+
+def _session_needs_database(items) -> bool:
+    """Indica se algum teste coletado acessa o banco."""
+    for item in items:
+        if item.get_closest_marker("django_db") is not None:
+            return True
+        test_class = getattr(item, "cls", None)
+        if test_class is not None and issubclass(test_class, TransactionTestCase):
+            return True
+    return False
+
+
+@pytest.fixture(scope="session", autouse=True)
+def reference_rows(request):
+    """
+    Fixture para popular as linhas de referência uma única vez por sessão.
+
+    Cria as situações de fornecedor e as linhas de `DOMAIN_SEED` em toda sessão com
+    testes de banco, independente de quais testes pedem `domain_rows`; com
+    `--reuse-db` o `ignore_conflicts` evita duplicar as linhas já existentes.
+    Roda antes do `setUpTestData` das classes, que já criam fornecedores; sessões
+    sem testes de banco não chegam a criar o banco de teste.
+    """
+    if not _session_needs_database(request.session.items):
+        return
+    request.getfixturevalue("django_db_setup")
+    django_db_blocker = request.getfixturevalue("django_db_blocker")
+    with django_db_blocker.unblock():
+        _seed_supplier_situation()
+        _DOMAIN_ROWS.update(_seed_domain_rows())
+
+
+@pytest.fixture(autouse=True)
+def reseed_after_transaction_flush(request):
+    """
+    Fixture para recriar os dados de sessão após o flush de um `TransactionTestCase`.
+
+    Com pytest-xdist a ordem das classes não é garantida, então as classes com
+    `setUpTestData` podem rodar depois de um flush no mesmo worker.
+    """
+    yield
+    test_class = request.cls
     if (
-        not DomSupplierSituation.objects.exists()
-        and not DomPendencyType.objects.exists()
+        test_class is None
+        or not issubclass(test_class, TransactionTestCase)
+        or issubclass(test_class, TestCase)
     ):
-        baker.make(
-            DomPendencyType,
-            id=DomPendecyTypeEnum.PENDENCIA_CADASTRO.value,
-            name="PENDÊNCIA DE CADASTRO",
-        )
-        baker.make(
-            DomPendencyType,
-            id=DomPendecyTypeEnum.PENDENCIA_DOCUMENTACAO.value,
-            name="PENDÊNCIA DE DOCUMENTAÇÃO",
-        )
-        baker.make(
-            DomPendencyType,
-            id=DomPendecyTypeEnum.PENDENCIA_MATRIZ_RESPONSABILIDADE.value,
-            name="PENDÊNCIA MATRIZ DE RESPONSABILIDADE",
-        )
-        baker.make(
-            DomPendencyType,
-            id=DomPendecyTypeEnum.PENDENCIA_AVALIACAO.value,
-            name="PENDÊNCIA DE AVALIAÇÃO",
-        )
-        baker.make(
-            DomSupplierSituation,
-            name="ATIVO",
-            pendency_type=None,
-        )
-        baker.make(
-            DomSupplierSituation,
-            name="PENDENTE",
-            pendency_type_id=DomPendecyTypeEnum.PENDENCIA_MATRIZ_RESPONSABILIDADE.value,
-        )
-        baker.make(
-            DomSupplierSituation,
-            name="PENDENTE",
-            pendency_type_id=DomPendecyTypeEnum.PENDENCIA_DOCUMENTACAO.value,
-        )
-        baker.make(
-            DomSupplierSituation,
-            name="PENDENTE",
-            pendency_type_id=DomPendecyTypeEnum.PENDENCIA_CADASTRO.value,
-        )
-        baker.make(
-            DomSupplierSituation,
-            name="PENDENTE",
-            pendency_type_id=DomPendecyTypeEnum.PENDENCIA_AVALIACAO.value,
-        )
+        return
+    _seed_supplier_situation()
+    _DOMAIN_ROWS.update(_seed_domain_rows())
 
 
 @pytest.fixture
@@ -4,11 +4,12 @@ This module contains tests for the SupplierAttachment model including
 creation, file handling, relationships, and unique constraints.
 """
 
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
+import pytest
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.db import IntegrityError
-from django.test import TestCase
+from django.db import IntegrityError, transaction
+from django.test import SimpleTestCase, TestCase
 
 from src.shared.models import Address, Contact
 from src.supplier.models.attachments import SupplierAttachment
@@ -43,127 +44,134 @@ from src.supplier.models.supplier import (
     Supplier,
 )
 
+_PDF_BYTES = b"file_content"
+
+
+def _make_pdf(name: str = "test_contract.pdf") -> SimpleUploadedFile:
+    """Build an in-memory PDF upload; its content is irrelevant to assertions."""
+    return SimpleUploadedFile(name, _PDF_BYTES, content_type="application/pdf")
+
+
+def _create_supplier(domain) -> Supplier:
+    """Create a fully registered supplier pointing at the seeded domain rows."""
+    address = Address.objects.create(postal_code="01234-567", number="123")
+    contact = Contact.objects.create(email="test@example.com", phone="11999999999")
+    payment_details = PaymentDetails.objects.create(
+        payment_frequency="Mensal",
+        payment_date="2024-01-15",
+        contract_total_value=60000.00,
+        contract_monthly_value=5000.00,
+        checking_account="12345",
+        payment_method=domain[DomPaymentMethod]["TED"],
+        pix_key_type=domain[DomPixType]["Email"],
+        pix_key="test@email.com",
+    )
+    organizational_details = OrganizationalDetails.objects.create(
+        cost_center="CC001",
+        business_unit="TI",
+        responsible_executive="João",
+        payer_type=domain[DomPayerType]["PJ"],
+        business_sector=domain[DomBusinessSector]["Tecnologia da Informação"],
+        taxpayer_classification=domain[DomTaxpayerClassification]["Normal"],
+        public_entity=domain[DomPublicEntity]["RFB"],
+    )
+    fiscal_details = FiscalDetails.objects.create(
+        iss_withholding=domain[DomIssWithholding]["No"],
+        iss_regime=domain[DomIssRegime]["Normal"],
+        iss_taxpayer=False,
+        simples_nacional_participant=True,
+        cooperative_member=False,
+        withholding_tax_nature=domain[DomWithholdingTax]["IRRF"],
+    )
+    company_information = CompanyInformation.objects.create(
+        company_size=domain[DomCompanySize]["Small"],
+        icms_taxpayer=domain[DomIcmsTaxpayer]["No"],
+        taxation_regime=domain[DomTaxationRegime]["Simple"],
+        income_type=domain[DomIncomeType]["Services"],
+        taxation_method=domain[DomTaxationMethod]["Normal"],
+        customer_type=domain[DomCustomerType]["B2B"],
+    )
+    contract = Contract.objects.create(
+        object_contract="Test Contract",
+        executed_activities="Test activities",
+        contract_start_date="2024-01-01",
+        contract_end_date="2024-12-31",
+    )
+    return Supplier.objects.create(
+        trade_name="Test Supplier",
+        legal_name="Test Supplier LTDA",
+        tax_id="12345678000190",
+        state_business_registration="123456789",
+        municipal_business_registration="987654321",
+        address=address,
+        contact=contact,
+        payment_details=payment_details,
+        organizational_details=organizational_details,
+        fiscal_details=fiscal_details,
+        company_information=company_information,
+        contract=contract,
+        classification=domain[DomClassification]["Test"],
+        category=domain[DomCategory]["Services"],
+        risk_level=domain[DomRiskLevel]["Low"],
+        type=domain[DomTypeSupplier]["Legal"],
+    )
+
+
+class TestSupplierAttachmentMeta(SimpleTestCase):
+    """Test cases for SupplierAttachment meta options."""
+
+    def test_meta_configuration(self):
+        """Test SupplierAttachment meta options without touching the database."""
+        meta = SupplierAttachment._meta
+
+        self.assertEqual(meta.db_table, "supplier_attachment")
+        self.assertEqual(meta.verbose_name, "Anexo de Fornecedor")
+        self.assertEqual(meta.verbose_name_plural, "Anexos de Fornecedor")
+        self.assertEqual(meta.unique_together, (("supplier", "attachment_type"),))
+
 
 class TestSupplierAttachment(TestCase):
     """Test cases for SupplierAttachment model."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.attachment_type = DomAttachmentType.objects.create(name="Contrato Social")
-
-        address = Address.objects.create(postal_code="01234-567", number="123")
-        contact = Contact.objects.create(email="test@example.com", phone="11999999999")
-
-        payment_method = DomPaymentMethod.objects.create(name="TED")
-        pix_type = DomPixType.objects.create(name="Email")
-        payment_details = PaymentDetails.objects.create(
-            payment_frequency="Mensal",
-            payment_date="2024-01-15",
-            contract_total_value=60000.00,
-            contract_monthly_value=5000.00,
-            checking_account="12345",
-            payment_method=payment_method,
-            pix_key_type=pix_type,
-            pix_key="test@email.com",
-        )
-
-        payer_type = DomPayerType.objects.create(name="PJ")
-        business_sector = DomBusinessSector.objects.create(name="Technology")
-        taxpayer_classification = DomTaxpayerClassification.objects.create(
-            name="Normal"
-        )
-        public_entity = DomPublicEntity.objects.create(name="RFB")
-        organizational_details = OrganizationalDetails.objects.create(
-            cost_center="CC001",
-            business_unit="TI",
-            responsible_executive="João",
-            payer_type=payer_type,
-            business_sector=business_sector,
-            taxpayer_classification=taxpayer_classification,
-            public_entity=public_entity,
-        )
-
-        iss_withholding = DomIssWithholding.objects.create(name="No")
-        iss_regime = DomIssRegime.objects.create(name="Normal")
-        withholding_tax = DomWithholdingTax.objects.create(name="IRRF")
-        fiscal_details = FiscalDetails.objects.create(
-            iss_withholding=iss_withholding,
-            iss_regime=iss_regime,
-            iss_taxpayer=False,
-            simples_nacional_participant=True,
-            cooperative_member=False,
-            withholding_tax_nature=withholding_tax,
-        )
-
-        company_size = DomCompanySize.objects.create(name="Small")
-        icms_taxpayer = DomIcmsTaxpayer.objects.create(name="No")
-        taxation_regime = DomTaxationRegime.objects.create(name="Simple")
-        income_type = DomIncomeType.objects.create(name="Services")
-        taxation_method = DomTaxationMethod.objects.create(name="Normal")
-        customer_type = DomCustomerType.objects.create(name="B2B")
-        company_information = CompanyInformation.objects.create(
-            company_size=company_size,
-            icms_taxpayer=icms_taxpayer,
-            taxation_regime=taxation_regime,
-            income_type=income_type,
-            taxation_method=taxation_method,
-            customer_type=customer_type,
-        )
+    uses_domain_rows = True
 
-        contract = Contract.objects.create(
-            object_contract="Test Contract",
-            executed_activities="Test activities",
-            contract_start_date="2024-01-01",
-            contract_end_date="2024-12-31",
-        )
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        cls.attachment_type = DomAttachmentType.objects.create(name="Contrato Social")
 
-        classification = DomClassification.objects.create(name="Test")
-        category = DomCategory.objects.create(name="Services")
-        risk_level = DomRiskLevel.objects.create(name="Low")
-        supplier_type = DomTypeSupplier.objects.create(name="Legal")
-
-        self.supplier = Supplier.objects.create(
-            trade_name="Test Supplier",
-            legal_name="Test Supplier LTDA",
-            tax_id="12345678000190",
-            state_business_registration="123456789",
-            municipal_business_registration="987654321",
-            address=address,
-            contact=contact,
-            payment_details=payment_details,
-            organizational_details=organizational_details,
-            fiscal_details=fiscal_details,
-            company_information=company_information,
-            contract=contract,
-            classification=classification,
-            category=category,
-            risk_level=risk_level,
-            type=supplier_type,
-        )
+        cls.supplier = _create_supplier(cls.domain_rows)
 
-        self.test_file = SimpleUploadedFile(
-            "test_contract.pdf", b"file_content", content_type="application/pdf"
-        )
+    def setUp(self):
+        """Set up a fresh upload; its read position is consumed on save."""
+        self.test_file = _make_pdf("test_contract.pdf")
 
+    @pytest.mark.usesstorage
     def test_supplier_attachment_creation(self):
         """Test supplier attachment creation with valid data."""
-        attachment = SupplierAttachment.objects.create(
-            supplier=self.supplier,
-            attachment_type=self.attachment_type,
-            file=self.test_file,
-            description="Contrato social da empresa teste",
-        )
+        # 1 INSERT + 5 reads from the attachment pendency post_save signal.
+        with self.assertNumQueries(6):
+            attachment = SupplierAttachment.objects.create(
+                supplier=self.supplier,
+                attachment_type=self.attachment_type,
+                file=self.test_file,
+                description="Contrato social da empresa teste",
+            )
+
+        attachment = SupplierAttachment.objects.select_related(
+            "supplier", "attachment_type"
+        ).get(pk=attachment.pk)
 
-        self.assertEqual(attachment.supplier, self.supplier)
-        self.assertEqual(attachment.attachment_type, self.attachment_type)
+        with self.assertNumQueries(0):
+            self.assertEqual(attachment.supplier, self.supplier)
+            self.assertEqual(attachment.attachment_type, self.attachment_type)
         self.assertEqual(attachment.description, "Contrato social da empresa teste")
         self.assertIsNotNone(attachment.file)
 
+    @pytest.mark.usesstorage
     def test_file_name_property(self):
         """Test the file_name property returns only the filename."""
-        test_file = SimpleUploadedFile(
-            "contract_social.pdf", b"file_content", content_type="application/pdf"
-        )
+        test_file = _make_pdf("contract_social.pdf")
 
         attachment = SupplierAttachment.objects.create(
             supplier=self.supplier, attachment_type=self.attachment_type, file=test_file
@@ -184,15 +192,12 @@ class TestSupplierAttachment(TestCase):
 
         self.assertIsNone(attachment.file_name)
 
-    @patch("src.supplier.models.attachments.SupplierAttachment.file")
-    def test_get_file_url_with_file(self, mock_file):
+    def test_get_file_url_with_file(self):
         """Test get_file_url method when file exists."""
-        mock_file.url = "/media/test/file.pdf"
-        mock_file.__bool__ = lambda x: True
-
         attachment = SupplierAttachment(
-            supplier=self.supplier, attachment_type=self.attachment_type, file=mock_file
+            supplier=self.supplier, attachment_type=self.attachment_type
         )
+        attachment.file = MagicMock(url="/media/test/file.pdf")
 
         self.assertEqual(attachment.get_file_url(), "/media/test/file.pdf")
 
@@ -204,15 +209,12 @@ class TestSupplierAttachment(TestCase):
 
         self.assertIsNone(attachment.get_file_url())
 
-    @patch("src.supplier.models.attachments.SupplierAttachment.file")
-    def test_storage_path_property(self, mock_file):
+    def test_storage_path_property(self):
         """Test storage_path property."""
-        mock_file.path = "/full/path/to/file.pdf"
-        mock_file.__bool__ = lambda x: True
-
         attachment = SupplierAttachment(
-            supplier=self.supplier, attachment_type=self.attachment_type, file=mock_file
+            supplier=self.supplier, attachment_type=self.attachment_type
         )
+        attachment.file = MagicMock(path="/full/path/to/file.pdf")
 
         self.assertEqual(attachment.storage_path, "/full/path/to/file.pdf")
 
@@ -224,6 +226,7 @@ class TestSupplierAttachment(TestCase):
 
         self.assertIsNone(attachment.storage_path)
 
+    @pytest.mark.usesstorage
     def test_unique_together_constraint(self):
         """Test that unique_together constraint is enforced."""
         SupplierAttachment.objects.create(
@@ -233,11 +236,9 @@ class TestSupplierAttachment(TestCase):
             description="First attachment",
         )
 
-        test_file_2 = SimpleUploadedFile(
-            "test_contract_2.pdf", b"different_content", content_type="application/pdf"
-        )
+        test_file_2 = _make_pdf("test_contract_2.pdf")
 
-        with self.assertRaises(IntegrityError):
+        with self.assertRaises(IntegrityError), transaction.atomic():
             SupplierAttachment.objects.create(
                 supplier=self.supplier,
                 attachment_type=self.attachment_type,
@@ -245,62 +246,32 @@ class TestSupplierAttachment(TestCase):
                 description="Second attachment",
             )
 
+    @pytest.mark.usesstorage
     def test_different_attachment_types_allowed(self):
         """Test that same supplier can have multiple attachments of different types."""
         attachment_type_2 = DomAttachmentType.objects.create(name="CNPJ")
 
-        attachment_1 = SupplierAttachment.objects.create(
-            supplier=self.supplier,
-            attachment_type=self.attachment_type,
-            file=self.test_file,
-            description="First attachment",
-        )
-
-        test_file_2 = SimpleUploadedFile(
-            "cnpj.pdf", b"cnpj_content", content_type="application/pdf"
-        )
+        test_file_2 = _make_pdf("cnpj.pdf")
 
-        attachment_2 = SupplierAttachment.objects.create(
-            supplier=self.supplier,
-            attachment_type=attachment_type_2,
-            file=test_file_2,
-            description="Second attachment",
-        )
+        # 6 queries per create: 1 INSERT + 5 pendency signal reads.
+        with self.assertNumQueries(12):
+            attachment_1 = SupplierAttachment.objects.create(
+                supplier=self.supplier,
+                attachment_type=self.attachment_type,
+                file=self.test_file,
+                description="First attachment",
+            )
+            attachment_2 = SupplierAttachment.objects.create(
+                supplier=self.supplier,
+                attachment_type=attachment_type_2,
+                file=test_file_2,
+                description="Second attachment",
+            )
 
         self.assertTrue(SupplierAttachment.objects.filter(pk=attachment_1.pk).exists())
         self.assertTrue(SupplierAttachment.objects.filter(pk=attachment_2.pk).exists())
 
-    def test_cascade_deletion_from_supplier(self):
-        """Test that deleting supplier cascades to attachments."""
-        attachment = SupplierAttachment.objects.create(
-            supplier=self.supplier,
-            attachment_type=self.attachment_type,
-            file=self.test_file,
-            description="Test attachment",
-        )
-
-        attachment_id = attachment.pk
-
-        self.supplier.delete()
-
-        self.assertFalse(SupplierAttachment.objects.filter(pk=attachment_id).exists())
-
-    def test_do_nothing_deletion_from_attachment_type(self):
-        """Test that deleting attachment type doesn't delete attachments."""
-        attachment = SupplierAttachment.objects.create(
-            supplier=self.supplier,
-            attachment_type=self.attachment_type,
-            file=self.test_file,
-            description="Test attachment",
-        )
-
-        attachment_id = attachment.pk
-
-        with self.assertRaises(Exception):
-            self.attachment_type.delete()
-
-        self.assertTrue(SupplierAttachment.objects.filter(pk=attachment_id).exists())
-
+    @pytest.mark.usesstorage
     def test_attachment_relationships(self):
         """Test attachment model relationships."""
         attachment = SupplierAttachment.objects.create(
@@ -309,9 +280,13 @@ class TestSupplierAttachment(TestCase):
             file=self.test_file,
             description="Relationship test",
         )
+        attachment = SupplierAttachment.objects.select_related(
+            "supplier", "attachment_type"
+        ).get(pk=attachment.pk)
 
-        self.assertEqual(attachment.supplier, self.supplier)
-        self.assertEqual(attachment.attachment_type, self.attachment_type)
+        with self.assertNumQueries(0):
+            self.assertEqual(attachment.supplier, self.supplier)
+            self.assertEqual(attachment.attachment_type, self.attachment_type)
 
         supplier_attachments = SupplierAttachment.objects.filter(supplier=self.supplier)
         self.assertIn(attachment, supplier_attachments)
@@ -325,108 +300,21 @@ class TestSupplierAttachment(TestCase):
 class TestSupplierAttachmentQueryMethods(TestCase):
     """Test cases for SupplierAttachment query methods and filtering."""
 
-    def setUp(self):
-        """Set up test data for query tests."""
-        self.contract_type = DomAttachmentType.objects.create(name="Contrato Social")
-        self.cnpj_type = DomAttachmentType.objects.create(name="CNPJ")
-
-        address = Address.objects.create(postal_code="01234-567", number="123")
-        contact = Contact.objects.create(email="test@example.com", phone="11999999999")
-
-        payment_method = DomPaymentMethod.objects.create(name="TED")
-        pix_type = DomPixType.objects.create(name="Email")
-        payment_details = PaymentDetails.objects.create(
-            payment_frequency="Mensal",
-            payment_date="2024-01-15",
-            contract_total_value=60000.00,
-            contract_monthly_value=5000.00,
-            checking_account="12345",
-            payment_method=payment_method,
-            pix_key_type=pix_type,
-            pix_key="test@email.com",
-        )
-
-        payer_type = DomPayerType.objects.create(name="PJ")
-        business_sector = DomBusinessSector.objects.create(name="Tech")
-        taxpayer_classification = DomTaxpayerClassification.objects.create(
-            name="Normal"
-        )
-        public_entity = DomPublicEntity.objects.create(name="RFB")
-        organizational_details = OrganizationalDetails.objects.create(
-            cost_center="CC001",
-            business_unit="TI",
-            responsible_executive="João",
-            payer_type=payer_type,
-            business_sector=business_sector,
-            taxpayer_classification=taxpayer_classification,
-            public_entity=public_entity,
-        )
-
-        iss_withholding = DomIssWithholding.objects.create(name="No")
-        iss_regime = DomIssRegime.objects.create(name="Normal")
-        withholding_tax = DomWithholdingTax.objects.create(name="IRRF")
-        fiscal_details = FiscalDetails.objects.create(
-            iss_withholding=iss_withholding,
-            iss_regime=iss_regime,
-            iss_taxpayer=False,
-            simples_nacional_participant=True,
-            cooperative_member=False,
-            withholding_tax_nature=withholding_tax,
-        )
-
-        company_size = DomCompanySize.objects.create(name="Small")
-        icms_taxpayer = DomIcmsTaxpayer.objects.create(name="No")
-        taxation_regime = DomTaxationRegime.objects.create(name="Simple")
-        income_type = DomIncomeType.objects.create(name="Services")
-        taxation_method = DomTaxationMethod.objects.create(name="Normal")
-        customer_type = DomCustomerType.objects.create(name="B2B")
-        company_information = CompanyInformation.objects.create(
-            company_size=company_size,
-            icms_taxpayer=icms_taxpayer,
-            taxation_regime=taxation_regime,
-            income_type=income_type,
-            taxation_method=taxation_method,
-            customer_type=customer_type,
-        )
+    uses_domain_rows = True
 
-        contract = Contract.objects.create(
-            object_contract="Test Contract",
-            executed_activities="Test activities",
-            contract_start_date="2024-01-01",
-            contract_end_date="2024-12-31",
-        )
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data for query tests."""
+        cls.contract_type = DomAttachmentType.objects.create(name="Contrato Social")
+        cls.cnpj_type = DomAttachmentType.objects.create(name="CNPJ")
 
-        classification = DomClassification.objects.create(name="Test")
-        category = DomCategory.objects.create(name="Services")
-        risk_level = DomRiskLevel.objects.create(name="Low")
-        supplier_type = DomTypeSupplier.objects.create(name="Legal")
-        self.supplier = Supplier.objects.create(
-            trade_name="Test Supplier",
-            legal_name="Test Supplier LTDA",
-            tax_id="12345678000190",
-            state_business_registration="123456789",
-            municipal_business_registration="987654321",
-            address=address,
-            contact=contact,
-            payment_details=payment_details,
-            organizational_details=organizational_details,
-            fiscal_details=fiscal_details,
-            company_information=company_information,
-            contract=contract,
-            classification=classification,
-            category=category,
-            risk_level=risk_level,
-            type=supplier_type,
-        )
+        cls.supplier = _create_supplier(cls.domain_rows)
 
+    @pytest.mark.usesstorage
     def test_filter_by_attachment_type(self):
         """Test filtering attachments by type."""
-        contract_file = SimpleUploadedFile(
-            "contract.pdf", b"contract_content", content_type="application/pdf"
-        )
-        cnpj_file = SimpleUploadedFile(
-            "cnpj.pdf", b"cnpj_content", content_type="application/pdf"
-        )
+        contract_file = _make_pdf("contract.pdf")
+        cnpj_file = _make_pdf("cnpj.pdf")
 
         contract_attachment = SupplierAttachment.objects.create(
             supplier=self.supplier,
@@ -449,11 +337,10 @@ class TestSupplierAttachmentQueryMethods(TestCase):
         self.assertIn(cnpj_attachment, cnpj_attachments)
         self.assertNotIn(contract_attachment, cnpj_attachments)
 
+    @pytest.mark.usesstorage
     def test_filter_by_supplier(self):
         """Test filtering attachments by supplier."""
-        test_file = SimpleUploadedFile(
-            "test.pdf", b"content", content_type="application/pdf"
-        )
+        test_file = _make_pdf("test.pdf")
 
         attachment = SupplierAttachment.objects.create(
             supplier=self.supplier, attachment_type=self.contract_type, file=test_file
@@ -462,11 +349,10 @@ class TestSupplierAttachmentQueryMethods(TestCase):
         supplier_attachments = SupplierAttachment.objects.filter(supplier=self.supplier)
         self.assertIn(attachment, supplier_attachments)
 
+    @pytest.mark.usesstorage
     def test_count_attachments_by_type(self):
         """Test counting attachments by type."""
-        test_file_1 = SimpleUploadedFile(
-            "test1.pdf", b"content1", content_type="application/pdf"
-        )
+        test_file_1 = _make_pdf("test1.pdf")
 
         SupplierAttachment.objects.create(
             supplier=self.supplier, attachment_type=self.contract_type, file=test_file_1
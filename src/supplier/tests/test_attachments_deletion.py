@@ -0,0 +1,71 @@
+"""
+Tests for SupplierAttachment deletion behaviour.
+This module isolates the ON DELETE tests in a TransactionTestCase so the
+remaining attachment tests keep running on the cheaper TestCase rollback.
+"""
+
+import pytest
+from django.db import connection
+from django.db.models import ProtectedError
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+
+from src.supplier.models.attachments import SupplierAttachment
+from src.supplier.models.domain import DomAttachmentType
+
+# Registers the evaluation models so the Supplier.delete() cascade is stable.
+from src.supplier.models.evaluation import SupplierEvaluation  # noqa: F401
+from src.supplier.models.supplier import Supplier
+from src.supplier.tests.test_attachments import _make_pdf
+
+# Transaction control (BEGIN/COMMIT/SAVEPOINT) varies by backend and is not pinned.
+_DATA_STATEMENTS = ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+
+def _data_queries(captured_queries) -> list:
+    """Return the captured SQL statements that read or write rows."""
+    return [
+        query["sql"]
+        for query in captured_queries
+        if query["sql"].lstrip().upper().startswith(_DATA_STATEMENTS)
+    ]
+
+
+@pytest.mark.usesstorage
+class TestSupplierAttachmentDeletion(TransactionTestCase):
+    """Test cases for SupplierAttachment ON DELETE semantics."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.attachment_type = DomAttachmentType.objects.create(name="Contrato Social")
+        self.supplier = baker.make(Supplier, trade_name="Test Supplier")
+        self.attachment = SupplierAttachment.objects.create(
+            supplier=self.supplier,
+            attachment_type=self.attachment_type,
+            file=_make_pdf("test_contract.pdf"),
+            description="Test attachment",
+        )
+
+    def test_cascade_deletion_from_supplier(self):
+        """Test that deleting supplier cascades to attachments."""
+        with CaptureQueriesContext(connection) as queries:
+            self.supplier.delete()
+
+        # Two SELECTs for relations that cannot be fast-deleted (attachments,
+        # evaluations), one DELETE per cascaded table and the UPDATE nulling
+        # attachment history links.
+        self.assertEqual(len(_data_queries(queries.captured_queries)), 10)
+
+        self.assertFalse(
+            SupplierAttachment.objects.filter(pk=self.attachment.pk).exists()
+        )
+
+    def test_do_nothing_deletion_from_attachment_type(self):
+        """Test that deleting attachment type doesn't delete attachments."""
+        with self.assertRaises(ProtectedError):
+            self.attachment_type.delete()
+
+        self.assertTrue(
+            SupplierAttachment.objects.filter(pk=self.attachment.pk).exists()
+        )
@@ -1,10 +1,11 @@
 """Tests for evaluation endpoints and model rules."""
 
-import json
 from datetime import date
 from decimal import Decimal
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APIClient
 
@@ -17,52 +18,70 @@ from src.supplier.models.evaluation import (
 )
 from src.supplier.models.supplier import Supplier
 
+CRITERIA_LIST_URL = "/api/v1/evaluation/criteria-list/"
+EVALUATIONS_LIST_URL = "/api/v1/evaluation/evaluations-list/"
+EVALUATIONS_URL = "/api/v1/evaluation/evaluations/"
 
-class BaseEvaluationViewTestCase(TestCase):
-    """Base class for evaluation endpoint tests."""
+# (80 * 30 + 70 * 40 + 90 * 30) / (30 + 40 + 30) for the fixture scores below.
+EXPECTED_FINAL_SCORE = Decimal("79.00")
 
-    def setUp(self):
-        self.client = APIClient()
-        self.client.credentials(
-            HTTP_AUTHORIZATION="Bearer test-token",
-            HTTP_X_AUTHENTICATED_USER_ID="1",
-            HTTP_X_AUTHENTICATED_USER_EMAIL="tests@solutis.com.br",
-            HTTP_X_AUTHENTICATED_USER_FULL_NAME="Test User",
-            HTTP_X_AUTHENTICATED_USER_GROUP="Compras",
-        )
 
-        self.supplier_category = DomCategory.objects.create(name="Test Category")
-        self.supplier_type = DomTypeSupplier.objects.create(name="Test Type")
+class BaseEvaluationViewTestCase(TestCase):
+    """Base class for evaluation endpoint tests."""
 
-        self.supplier = Supplier.objects.create(
+    client_class = APIClient
+    uses_domain_rows = True
+
+    # Queries issued while building the shared fixtures below:
+    # - 9 for the supplier: its INSERT, five reads from the pendency post_save
+    #   signal and the SupplierSituation INSERT inside a savepoint;
+    # - 3 criterion INSERTs;
+    # - 12 for the evaluation INSERT, including the year-cycle lock
+    #   get_or_create and sync, with their savepoints;
+    # - 1 bulk INSERT for the criterion scores;
+    # - 11 for the final save() that computes final_score.
+    FIXTURE_QUERY_COUNT = 36
+
+    @classmethod
+    def setUpTestData(cls):
+        with CaptureQueriesContext(connection) as queries:
+            cls._create_fixtures()
+        cls.fixture_query_count = len(queries.captured_queries)
+
+    @classmethod
+    def _create_fixtures(cls):
+        cls.supplier_category = cls.domain_rows[DomCategory]["Services"]
+        cls.supplier_type = cls.domain_rows[DomTypeSupplier]["Legal"]
+
+        cls.supplier = Supplier.objects.create(
             trade_name="Test Supplier",
             legal_name="Test Legal Name",
             tax_id="12345678901234",
-            category=self.supplier_category,
-            type=self.supplier_type,
+            category=cls.supplier_category,
+            type=cls.supplier_type,
         )
 
-        self.criterion1 = EvaluationCriterion.objects.create(
+        cls.criterion1 = EvaluationCriterion.objects.create(
             name="Quality",
             description="Product quality assessment",
             weight=Decimal("30.00"),
             order=1,
         )
-        self.criterion2 = EvaluationCriterion.objects.create(
+        cls.criterion2 = EvaluationCriterion.objects.create(
             name="Delivery Time",
             description="Timeliness of deliveries",
             weight=Decimal("40.00"),
             order=2,
         )
-        self.criterion3 = EvaluationCriterion.objects.create(
+        cls.criterion3 = EvaluationCriterion.objects.create(
             name="Price",
             description="Price competitiveness",
             weight=Decimal("30.00"),
             order=3,
         )
 
-        self.evaluation = SupplierEvaluation.objects.create(
-            supplier=self.supplier,
+        cls.evaluation = SupplierEvaluation.objects.create(
+            supplier=cls.supplier,
             evaluation_year=2026,
             period_type="QUADRIMESTER",
             period_number=1,
@@ -70,46 +89,71 @@ class BaseEvaluationViewTestCase(TestCase):
             comments="Initial evaluation comments",
         )
 
-        self.score1 = CriterionScore.objects.create(
-            evaluation=self.evaluation,
-            criterion=self.criterion1,
-            score=Decimal("80.00"),
-            comments="Good quality",
-        )
-        self.score2 = CriterionScore.objects.create(
-            evaluation=self.evaluation,
-            criterion=self.criterion2,
-            score=Decimal("70.00"),
-            comments="Acceptable delivery times",
-        )
-        self.score3 = CriterionScore.objects.create(
-            evaluation=self.evaluation,
-            criterion=self.criterion3,
-            score=Decimal("90.00"),
-            comments="Excellent pricing",
+        cls.scores = CriterionScore.objects.bulk_create(
+            [
+                CriterionScore(
+                    evaluation=cls.evaluation,
+                    criterion=cls.criterion1,
+                    score=Decimal("80.00"),
+                    comments="Good quality",
+                ),
+                CriterionScore(
+                    evaluation=cls.evaluation,
+                    criterion=cls.criterion2,
+                    score=Decimal("70.00"),
+                    comments="Acceptable delivery times",
+                ),
+                CriterionScore(
+                    evaluation=cls.evaluation,
+                    criterion=cls.criterion3,
+                    score=Decimal("90.00"),
+                    comments="Excellent pricing",
+                ),
+            ]
         )
+        # final_score is computed once, after all criterion scores exist.
+        cls.evaluation.save()
 
-        self.evaluation.save()
-        weighted_sum = (
-            self.score1.score * self.criterion1.weight
-            + self.score2.score * self.criterion2.weight
-            + self.score3.score * self.criterion3.weight
-        )
-        total_weight = (
-            self.criterion1.weight + self.criterion2.weight + self.criterion3.weight
+    def setUp(self):
+        self.client.credentials(
+            HTTP_AUTHORIZATION="Bearer test-token",
+            HTTP_X_AUTHENTICATED_USER_ID="1",
+            HTTP_X_AUTHENTICATED_USER_EMAIL="tests@solutis.com.br",
+            HTTP_X_AUTHENTICATED_USER_FULL_NAME="Test User",
+            HTTP_X_AUTHENTICATED_USER_GROUP="Compras",
         )
-        self.assertEqual(self.evaluation.final_score, weighted_sum / total_weight)
+
+
+class SupplierEvaluationFinalScoreTestCase(BaseEvaluationViewTestCase):
+    """Tests for the weighted final score computed on save."""
+
+    def test_fixture_setup_query_count(self):
+        self.assertEqual(self.fixture_query_count, self.FIXTURE_QUERY_COUNT)
+
+    def test_final_score_is_weighted_average_of_criterion_scores(self):
+        # 1. previous supplier/year read;
+        # 2. criterion scores joined with their criteria (select_related);
+        # 3. SAVEPOINT for save()'s atomic block;
+        # 4. year-cycle lock get_or_create lookup;
+        # 5. UPDATE of the evaluation;
+        # 6. distinct period types read by sync_year_cycle_lock;
+        # 7-9. SAVEPOINT, lookup and UPDATE from the lock's update_or_create;
+        # 10-11. RELEASE of both savepoints.
+        with self.assertNumQueries(11):
+            self.evaluation.save()
+
+        self.assertEqual(self.evaluation.final_score, EXPECTED_FINAL_SCORE)
 
 
 class EvaluationCriterionViewSetTestCase(BaseEvaluationViewTestCase):
     """Tests for criterion endpoints."""
 
     def test_list_criteria(self):
-        url = "/api/v1/evaluation/criteria-list/"
+        url = CRITERIA_LIST_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        data = json.loads(response.content)
+        data = response.json()
         self.assertIn("results", data)
         results = data["results"]
         self.assertEqual(len(results), 3)
@@ -122,11 +166,11 @@ class SupplierEvaluationViewSetTestCase(BaseEvaluationViewTestCase):
     """Tests for supplier evaluation endpoints."""
 
     def test_list_evaluations(self):
-        url = "/api/v1/evaluation/evaluations-list/"
+        url = EVALUATIONS_LIST_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        data = json.loads(response.content)
+        data = response.json()
         self.assertIn("results", data)
         results = data["results"]
         self.assertEqual(len(results), 1)
@@ -136,7 +180,7 @@ class SupplierEvaluationViewSetTestCase(BaseEvaluationViewTestCase):
         self.assertEqual(results[0]["periodNumber"], 1)
 
     def test_create_evaluation(self):
-        url = "/api/v1/evaluation/evaluations/"
+        url = EVALUATIONS_URL
         data = {
             "supplier": self.supplier.pk,
             "evaluationYear": 2026,
@@ -150,7 +194,7 @@ class SupplierEvaluationViewSetTestCase(BaseEvaluationViewTestCase):
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(SupplierEvaluation.objects.count(), 2)
-        result = json.loads(response.content)
+        result = response.json()
         self.assertEqual(result["evaluatorName"], "Another Evaluator")
         self.assertEqual(result["evaluationYear"], 2026)
         self.assertEqual(result["periodType"], "QUADRIMESTER")
@@ -158,7 +202,7 @@ class SupplierEvaluationViewSetTestCase(BaseEvaluationViewTestCase):
         self.assertIsNone(result["finalScore"])
 
     def test_duplicate_supplier_year_period_returns_400(self):
-        url = "/api/v1/evaluation/evaluations/"
+        url = EVALUATIONS_URL
         data = {
             "supplier": self.supplier.pk,
             "evaluationYear": 2026,
@@ -170,7 +214,7 @@ class SupplierEvaluationViewSetTestCase(BaseEvaluationViewTestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_rejects_mixed_period_type_same_supplier_year(self):
-        url = "/api/v1/evaluation/evaluations/"
+        url = EVALUATIONS_URL
         data = {
             "supplier": self.supplier.pk,
             "evaluationYear": 2026,
@@ -182,7 +226,7 @@ class SupplierEvaluationViewSetTestCase(BaseEvaluationViewTestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_rejects_invalid_period_number_for_semester(self):
-        url = "/api/v1/evaluation/evaluations/"
+        url = EVALUATIONS_URL
         data = {
             "supplier": self.supplier.pk,
             "evaluationYear": 2027,
@@ -194,11 +238,11 @@ class SupplierEvaluationViewSetTestCase(BaseEvaluationViewTestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_retrieve_evaluation_detail(self):
-        url = f"/api/v1/evaluation/evaluations/{self.evaluation.pk}/"
+        url = f"{EVALUATIONS_URL}{self.evaluation.pk}/"
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        result = json.loads(response.content)
+        result = response.json()
         self.assertEqual(result["id"], self.evaluation.pk)
         self.assertEqual(result["evaluationYear"], 2026)
         self.assertEqual(result["periodType"], "QUADRIMESTER")
@@ -208,22 +252,22 @@ class SupplierEvaluationViewSetTestCase(BaseEvaluationViewTestCase):
         self.assertIsNotNone(result["finalScore"])
 
     def test_filter_evaluations_by_supplier(self):
-        url = "/api/v1/evaluation/evaluations-list/"
+        url = EVALUATIONS_LIST_URL
         response = self.client.get(f"{url}?supplier={self.supplier.pk}")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        data = json.loads(response.content)
+        data = response.json()
         self.assertIn("results", data)
         self.assertEqual(len(data["results"]), 1)
 
     def test_filter_evaluations_by_year_type_number(self):
-        url = "/api/v1/evaluation/evaluations-list/"
+        url = EVALUATIONS_LIST_URL
         response = self.client.get(
             f"{url}?evaluationYear=2026&periodType=QUADRIMESTER&periodNumber=1"
         )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        data = json.loads(response.content)
+        data = response.json()
         self.assertIn("results", data)
         self.assertEqual(len(data["results"]), 1)
         self.assertEqual(data["results"][0]["evaluationYear"], 2026)
@@ -240,7 +284,7 @@ class SupplierEvaluationViewSetTestCase(BaseEvaluationViewTestCase):
             comments="Evaluation without scores",
         )
 
-        url = f"/api/v1/evaluation/evaluations/{new_evaluation.pk}/scores/"
+        url = f"{EVALUATIONS_URL}{new_evaluation.pk}/scores/"
         data = [
             {
                 "criterion": self.criterion1.pk,
@@ -6,13 +6,29 @@ from model_bakery import baker
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from src.api.v1.routers import domain as domain_router
 from src.supplier.models.approval_workflow import ApprovalStep
 from src.supplier.models.attachments import DomAttachmentType
 from src.supplier.models.domain import (
     DomBusinessSector,
     DomCategory,
+    DomClassification,
+    DomCompanySize,
+    DomCustomerType,
+    DomIcmsTaxpayer,
+    DomIncomeType,
+    DomIssRegime,
+    DomIssWithholding,
+    DomPayerType,
+    DomPaymentMethod,
+    DomPixType,
+    DomPublicEntity,
     DomRiskLevel,
+    DomTaxationMethod,
+    DomTaxationRegime,
+    DomTaxpayerClassification,
     DomTypeSupplier,
+    DomWithholdingTax,
 )
 from src.supplier.models.evaluation import EvaluationCriterion
 from src.supplier.models.responsibility_matrix import ResponsibilityMatrix
@@ -31,6 +47,16 @@ def _auth_client() -> APIClient:
     return client
 
 
+def _make_supplier(domain_rows, **fields) -> Supplier:
+    """Create a supplier whose category and type are the session-seeded rows."""
+    return baker.make(
+        Supplier,
+        category=domain_rows[DomCategory]["Services"],
+        type=domain_rows[DomTypeSupplier]["Legal"],
+        **fields,
+    )
+
+
 @pytest.mark.django_db
 def test_ninja_v1_requires_proxy_headers():
     client = APIClient()
@@ -67,7 +93,10 @@ def test_ninja_v1_create_and_list_suppliers():
 
 
 @pytest.mark.django_db
-def test_ninja_v1_attachments_upload_list_and_download():
+def test_ninja_v1_attachments_upload_list_and_download(settings, tmp_path):
+    # The download endpoint checks the file on disk, so this test keeps
+    # FileSystemStorage and points it at a temporary MEDIA_ROOT.
+    settings.MEDIA_ROOT = str(tmp_path)
     supplier = baker.make(
         Supplier, legal_name="Fornecedor Attach", tax_id="11122233344488"
     )
@@ -100,6 +129,7 @@ def test_ninja_v1_attachments_upload_list_and_download():
 
 
 @pytest.mark.django_db
+@pytest.mark.usesstorage
 def test_ninja_v1_attachment_history_by_type():
     supplier = baker.make(
         Supplier, legal_name="Fornecedor Historico", tax_id="11122233344433"
@@ -196,6 +226,7 @@ def test_ninja_v1_attachment_type_rejects_invalid_risk_level():
 
 
 @pytest.mark.django_db
+@pytest.mark.usesstorage
 def test_ninja_v1_attachment_type_delete_rejects_when_in_use():
     supplier = baker.make(
         Supplier, legal_name="Fornecedor Attach Delete", tax_id="11122233344455"
@@ -302,24 +333,54 @@ def test_ninja_v1_responsibility_matrix_crud_and_delete_blocked():
 
 @pytest.mark.django_db
 def test_ninja_v1_domain_endpoints():
-    baker.make(DomBusinessSector, name="Tecnologia")
+    sector = baker.make(DomBusinessSector, name="Tecnologia")
     client = _auth_client()
 
     response = client.get("/api/v1/domain/business-sectors/")
     assert response.status_code == status.HTTP_200_OK
     payload = response.json()
     assert isinstance(payload, list)
-    assert payload[0]["name"] == "Tecnologia"
+    assert {"id": sector.id, "name": "Tecnologia"} in payload
 
 
 @pytest.mark.django_db
-def test_ninja_v1_evaluation_endpoints():
-    supplier = baker.make(
-        Supplier,
-        legal_name="Fornecedor Avaliado",
-        tax_id="11122233344411",
-        category=baker.make(DomCategory, name="Categoria A"),
-        type=baker.make(DomTypeSupplier, name="Tipo A"),
+@pytest.mark.parametrize(
+    "handler, model",
+    [
+        (domain_router.list_classifications, DomClassification),
+        (domain_router.list_categories, DomCategory),
+        (domain_router.list_risk_levels, DomRiskLevel),
+        (domain_router.list_supplier_types, DomTypeSupplier),
+        (domain_router.list_pix_types, DomPixType),
+        (domain_router.list_payment_methods, DomPaymentMethod),
+        (domain_router.list_payer_types, DomPayerType),
+        (domain_router.list_business_sectors, DomBusinessSector),
+        (domain_router.list_company_sizes, DomCompanySize),
+        (domain_router.list_customer_types, DomCustomerType),
+        (domain_router.list_taxpayer_classifications, DomTaxpayerClassification),
+        (domain_router.list_taxation_regimes, DomTaxationRegime),
+        (domain_router.list_taxation_methods, DomTaxationMethod),
+        (domain_router.list_icms_taxpayers, DomIcmsTaxpayer),
+        (domain_router.list_withholding_taxes, DomWithholdingTax),
+        (domain_router.list_iss_withholdings, DomIssWithholding),
+        (domain_router.list_iss_regimes, DomIssRegime),
+        (domain_router.list_income_types, DomIncomeType),
+        (domain_router.list_public_entities, DomPublicEntity),
+    ],
+)
+def test_ninja_v1_domain_handlers_list_items(handler, model, domain_rows, rf):
+    # Handlers are called directly; test_ninja_v1_domain_endpoints covers the
+    # full request stack (auth, routing, rendering).
+    payload = handler(rf.get("/"))
+
+    for row in domain_rows[model].values():
+        assert {"id": row.id, "name": row.name} in payload
+
+
+@pytest.mark.django_db
+def test_ninja_v1_evaluation_endpoints(domain_rows):
+    supplier = _make_supplier(
+        domain_rows, legal_name="Fornecedor Avaliado", tax_id="11122233344411"
     )
     criterion = baker.make(
         EvaluationCriterion,
@@ -363,13 +424,9 @@ def test_ninja_v1_evaluation_endpoints():
 
 
 @pytest.mark.django_db
-def test_ninja_v1_evaluation_rejects_mixed_period_type_same_supplier_year():
-    supplier = baker.make(
-        Supplier,
-        legal_name="Fornecedor Misto",
-        tax_id="11122233344888",
-        category=baker.make(DomCategory, name="Categoria Misto"),
-        type=baker.make(DomTypeSupplier, name="Tipo Misto"),
+def test_ninja_v1_evaluation_rejects_mixed_period_type_same_supplier_year(domain_rows):
+    supplier = _make_supplier(
+        domain_rows, legal_name="Fornecedor Misto", tax_id="11122233344888"
     )
     criterion = baker.make(
         EvaluationCriterion,
@@ -412,14 +469,12 @@ def test_ninja_v1_evaluation_rejects_mixed_period_type_same_supplier_year():
 
 
 @pytest.mark.django_db
-def test_ninja_v1_evaluation_create_with_evaluation_date_returns_iso_string():
+def test_ninja_v1_evaluation_create_with_evaluation_date_returns_iso_string(
+    domain_rows,
+):
     """POST with evaluationDate must not raise AttributeError on serialization."""
-    supplier = baker.make(
-        Supplier,
-        legal_name="Fornecedor Com Data",
-        tax_id="11122233300001",
-        category=baker.make(DomCategory, name="Categoria Data"),
-        type=baker.make(DomTypeSupplier, name="Tipo Data"),
+    supplier = _make_supplier(
+        domain_rows, legal_name="Fornecedor Com Data", tax_id="11122233300001"
     )
     client = _auth_client()
 
@@ -441,14 +496,10 @@ def test_ninja_v1_evaluation_create_with_evaluation_date_returns_iso_string():
 
 
 @pytest.mark.django_db
-def test_ninja_v1_evaluation_put_with_evaluation_date_no_attribute_error():
+def test_ninja_v1_evaluation_put_with_evaluation_date_no_attribute_error(domain_rows):
     """PUT with evaluationDate must not raise AttributeError on serialization."""
-    supplier = baker.make(
-        Supplier,
-        legal_name="Fornecedor PUT Data",
-        tax_id="11122233300002",
-        category=baker.make(DomCategory, name="Categoria PUT"),
-        type=baker.make(DomTypeSupplier, name="Tipo PUT"),
+    supplier = _make_supplier(
+        domain_rows, legal_name="Fornecedor PUT Data", tax_id="11122233300002"
     )
     client = _auth_client()
 
@@ -483,14 +534,10 @@ def test_ninja_v1_evaluation_put_with_evaluation_date_no_attribute_error():
 
 
 @pytest.mark.django_db
-def test_ninja_v1_evaluation_patch_with_evaluation_date_no_attribute_error():
+def test_ninja_v1_evaluation_patch_with_evaluation_date_no_attribute_error(domain_rows):
     """PATCH with evaluationDate must not raise AttributeError on serialization."""
-    supplier = baker.make(
-        Supplier,
-        legal_name="Fornecedor PATCH Data",
-        tax_id="11122233300003",
-        category=baker.make(DomCategory, name="Categoria PATCH"),
-        type=baker.make(DomTypeSupplier, name="Tipo PATCH"),
+    supplier = _make_supplier(
+        domain_rows, legal_name="Fornecedor PATCH Data", tax_id="11122233300003"
     )
     client = _auth_client()
 
@@ -518,18 +565,19 @@ def test_ninja_v1_evaluation_patch_with_evaluation_date_no_attribute_error():
 
 
 @pytest.mark.django_db
-def test_legacy_drf_supplier_routes_are_not_exposed_anymore():
-    client = _auth_client()
-
-    legacy_paths = [
+@pytest.mark.parametrize(
+    "path",
+    [
         "/api/suppliers-list/",
         "/api/domain/business-sectors/",
         "/api/evaluation/evaluations-list/",
         "/api/approval/steps/",
         "/api/attachments-list/1/",
         "/api/responsibility-matrix/1/",
-    ]
+    ],
+)
+def test_legacy_drf_supplier_routes_are_not_exposed_anymore(path):
+    client = _auth_client()
 
-    for path in legacy_paths:
-        response = client.get(path)
-        assert response.status_code == status.HTTP_404_NOT_FOUND
+    response = client.get(path)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -4,29 +4,69 @@ This module contains tests for the ResponsibilityMatrix model including
 creation, validation, relationships, and RACI matrix functionality.
 """
 
-from django.db import IntegrityError
-from django.test import TestCase
+from django.db import IntegrityError, connection, transaction
+from django.forms.models import model_to_dict
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
 from model_bakery import baker
 
+# Registers the evaluation models so the Supplier.delete() cascade is stable.
+from src.supplier.models.evaluation import SupplierEvaluation  # noqa: F401
 from src.supplier.models.responsibility_matrix import RACI_CHOICES, ResponsibilityMatrix
 from src.supplier.models.supplier import Supplier
 
+AREAS = (
+    "requesting_area",
+    "administrative",
+    "legal",
+    "financial",
+    "integrity",
+    "board",
+)
+ALL_ACTIVITIES = (
+    "contract_request",
+    "document_analysis",
+    "risk_consultation",
+    "risk_assessment",
+    "system_registration",
+    "form_handling",
+    "contract_draft",
+    "compliance_validation",
+    "final_approval",
+    "contract_signing",
+    "document_management",
+    "payment_release",
+    "contract_execution_monitoring",
+)
+ALL_ACTIVITY_FIELDS = frozenset(
+    f"{activity}_{area}" for activity in ALL_ACTIVITIES for area in AREAS
+)
+RACI_VALUES = frozenset(value for value, _ in RACI_CHOICES)
+MATRIX_FIELD_NAMES = frozenset(
+    field.name for field in ResponsibilityMatrix._meta.get_fields()
+)
+
 
 class TestResponsibilityMatrix(TestCase):
     """Test cases for ResponsibilityMatrix model."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data."""
-        self.supplier = baker.make(Supplier, trade_name="Test Supplier")
+        cls.supplier = baker.make(Supplier, trade_name="Test Supplier")
+        with CaptureQueriesContext(connection) as queries:
+            cls.matrix = ResponsibilityMatrix.objects.create(
+                supplier=cls.supplier,
+                contract_request_requesting_area="A",
+                contract_request_administrative="R",
+                document_analysis_legal="C",
+                risk_consultation_board="I",
+            )
+        cls.matrix_create_query_count = len(queries.captured_queries)
 
     def test_responsibility_matrix_creation(self):
         """Test responsibility matrix creation with default values."""
-        matrix = baker.make(
-            ResponsibilityMatrix,
-            supplier=self.supplier,
-            contract_request_requesting_area="A",
-            contract_request_administrative="R",
-        )
+        matrix = self.matrix
 
         self.assertEqual(matrix.supplier, self.supplier)
         self.assertEqual(matrix.contract_request_requesting_area, "A")
@@ -35,140 +75,86 @@ class TestResponsibilityMatrix(TestCase):
         self.assertEqual(matrix.contract_request_legal, "-")
         self.assertEqual(matrix.contract_request_financial, "-")
 
+    def test_matrix_creation_query_count(self):
+        """Test that creating a matrix keeps its post_save signal cost fixed."""
+        # 1. INSERT of the matrix.
+        # 2-3. supplier.situation, read twice by the pendency signal (no cache).
+        # 4. The current situation's status (DomSupplierSituation) lookup.
+        self.assertEqual(self.matrix_create_query_count, 4)
+
     def test_unique_supplier_constraint(self):
         """Test that each supplier can have only one responsibility matrix."""
-        baker.make(ResponsibilityMatrix, supplier=self.supplier)
-
-        with self.assertRaises(IntegrityError):
+        with self.assertRaises(IntegrityError), transaction.atomic():
             baker.make(ResponsibilityMatrix, supplier=self.supplier)
 
-    def test_all_activities_have_default_values(self):
-        """Test that all 12 activities have proper default values."""
-        matrix = baker.make(ResponsibilityMatrix, supplier=self.supplier)
-
-        activities = [
-            "contract_request_requesting_area",
-            "contract_request_administrative",
-            "contract_request_legal",
-            "contract_request_financial",
-            "contract_request_integrity",
-            "contract_request_board",
-            "document_analysis_requesting_area",
-            "document_analysis_administrative",
-            "document_analysis_legal",
-            "document_analysis_financial",
-            "document_analysis_integrity",
-            "document_analysis_board",
-        ]
-
-        for activity in activities:
-            value = getattr(matrix, activity)
-            self.assertIn(value, [choice[0] for choice in RACI_CHOICES])
-
     def test_matrix_cascade_deletion(self):
         """Test that matrix is deleted when supplier is deleted."""
-        matrix = baker.make(ResponsibilityMatrix, supplier=self.supplier)
-        matrix_id = matrix.pk
+        matrix_id = self.matrix.pk
 
-        self.supplier.delete()
+        # Attachment and evaluation id lookups plus six DELETEs: situation,
+        # attachment history, matrix, approval flow, evaluation cycle, supplier.
+        with self.assertNumQueries(8):
+            self.supplier.delete()
 
         self.assertFalse(ResponsibilityMatrix.objects.filter(id=matrix_id).exists())
 
+    def test_responsibility_matrix_custom_values(self):
+        """Test responsibility matrix creation with custom RACI values."""
+        with self.assertNumQueries(1):
+            matrix = ResponsibilityMatrix.objects.get(pk=self.matrix.pk)
+
+        self.assertEqual(matrix.contract_request_requesting_area, "A")
+        self.assertEqual(matrix.contract_request_administrative, "R")
+        self.assertEqual(matrix.document_analysis_legal, "C")
+        self.assertEqual(matrix.risk_consultation_board, "I")
+
+
+class TestResponsibilityMatrixDefinition(SimpleTestCase):
+    """Test cases for the ResponsibilityMatrix definition that need no database."""
+
+    def test_str_representation(self):
+        """Test string representation with an unsaved supplier."""
+        matrix = ResponsibilityMatrix(supplier=Supplier(trade_name="Unsaved Supplier"))
+
+        self.assertEqual(str(matrix), "Matriz de Responsabilidade - Unsaved Supplier")
+
+    def test_all_activities_have_default_values(self):
+        """Test that every activity defaults to "-" (not involved)."""
+        defaults = {
+            ResponsibilityMatrix._meta.get_field(name).default
+            for name in ALL_ACTIVITY_FIELDS
+        }
+
+        self.assertEqual(defaults, {"-"})
+
     def test_raci_choices_constants(self):
         """Test that RACI_CHOICES contains expected values."""
-        expected_choices = [
+        expected_choices = (
             ("A", "A - Accountable (Responsável)"),
             ("R", "R - Responsible (Executa)"),
             ("C", "C - Consulted (Consultado)"),
             ("I", "I - Informed (Informado)"),
             ("-", "- Não Envolvido"),
             ("A/R", "A/R - Responsável e Executa"),
-        ]
+        )
 
         self.assertEqual(RACI_CHOICES, expected_choices)
 
     def test_matrix_activities_coverage(self):
-        """Test that all business activities are covered in the matrix."""
-        matrix = baker.make(ResponsibilityMatrix, supplier=self.supplier)
-
-        contract_activities = [
-            "contract_request_requesting_area",
-            "contract_request_administrative",
-            "contract_request_legal",
-            "contract_request_financial",
-            "contract_request_integrity",
-            "contract_request_board",
-        ]
-
-        analysis_activities = [
-            "document_analysis_requesting_area",
-            "document_analysis_administrative",
-            "document_analysis_legal",
-            "document_analysis_financial",
-            "document_analysis_integrity",
-            "document_analysis_board",
-        ]
-
-        for activity in contract_activities + analysis_activities:
-            self.assertTrue(hasattr(matrix, activity))
-            value = getattr(matrix, activity)
-            self.assertIsNotNone(value)
-
-    def test_responsibility_matrix_custom_values(self):
-        """Test responsibility matrix creation with custom RACI values."""
-        matrix = ResponsibilityMatrix.objects.create(
-            supplier=self.supplier,
-            contract_request_requesting_area="A",
-            contract_request_administrative="R",
-            document_analysis_legal="C",
-            risk_consultation_board="I",
-        )
-
-        self.assertEqual(matrix.contract_request_requesting_area, "A")
-        self.assertEqual(matrix.contract_request_administrative, "R")
-        self.assertEqual(matrix.document_analysis_legal, "C")
-        self.assertEqual(matrix.risk_consultation_board, "I")
+        """Test that the RACI fields are exactly the activity x area grid."""
+        raci_fields = {
+            field.name: field
+            for field in ResponsibilityMatrix._meta.concrete_fields
+            if field.choices
+        }
+        values = model_to_dict(ResponsibilityMatrix(), fields=raci_fields)
+
+        self.assertEqual(set(raci_fields), ALL_ACTIVITY_FIELDS)
+        for name, field in raci_fields.items():
+            with self.subTest(field=name):
+                self.assertEqual({value for value, _ in field.choices}, RACI_VALUES)
+                self.assertIn(values[name], RACI_VALUES)
 
     def test_all_activity_fields_present(self):
         """Test that all expected activity fields are present."""
-        matrix = ResponsibilityMatrix.objects.create(supplier=self.supplier)
-
-        # Contract request activity fields
-        self.assertTrue(hasattr(matrix, "contract_request_requesting_area"))
-        self.assertTrue(hasattr(matrix, "contract_request_administrative"))
-        self.assertTrue(hasattr(matrix, "contract_request_legal"))
-        self.assertTrue(hasattr(matrix, "contract_request_financial"))
-        self.assertTrue(hasattr(matrix, "contract_request_integrity"))
-        self.assertTrue(hasattr(matrix, "contract_request_board"))
-
-        # Document analysis activity fields
-        self.assertTrue(hasattr(matrix, "document_analysis_requesting_area"))
-        self.assertTrue(hasattr(matrix, "document_analysis_administrative"))
-        self.assertTrue(hasattr(matrix, "document_analysis_legal"))
-        self.assertTrue(hasattr(matrix, "document_analysis_financial"))
-        self.assertTrue(hasattr(matrix, "document_analysis_integrity"))
-        self.assertTrue(hasattr(matrix, "document_analysis_board"))
-
-        # Risk consultation activity fields
-        self.assertTrue(hasattr(matrix, "risk_consultation_requesting_area"))
-        self.assertTrue(hasattr(matrix, "risk_consultation_administrative"))
-        self.assertTrue(hasattr(matrix, "risk_consultation_legal"))
-        self.assertTrue(hasattr(matrix, "risk_consultation_financial"))
-        self.assertTrue(hasattr(matrix, "risk_consultation_integrity"))
-        self.assertTrue(hasattr(matrix, "risk_consultation_board"))
-
-        # Final approval activity fields
-        self.assertTrue(hasattr(matrix, "final_approval_requesting_area"))
-        self.assertTrue(hasattr(matrix, "final_approval_administrative"))
-        self.assertTrue(hasattr(matrix, "final_approval_legal"))
-        self.assertTrue(hasattr(matrix, "final_approval_financial"))
-        self.assertTrue(hasattr(matrix, "final_approval_integrity"))
-        self.assertTrue(hasattr(matrix, "final_approval_board"))
-
-        # Payment release activity fields
-        self.assertTrue(hasattr(matrix, "payment_release_requesting_area"))
-        self.assertTrue(hasattr(matrix, "payment_release_administrative"))
-        self.assertTrue(hasattr(matrix, "payment_release_legal"))
-        self.assertTrue(hasattr(matrix, "payment_release_financial"))
-        self.assertTrue(hasattr(matrix, "payment_release_integrity"))
-        self.assertTrue(hasattr(matrix, "payment_release_board"))
+        self.assertFalse(ALL_ACTIVITY_FIELDS - MATRIX_FIELD_NAMES)
@@ -3,20 +3,58 @@
 from datetime import date
 from decimal import Decimal
 
+import pytest
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
 from model_bakery import baker
 
 from src.supplier.enums import DomPendecyTypeEnum
 from src.supplier.models.attachments import SupplierAttachment
-from src.supplier.models.domain import DomAttachmentType, DomSupplierSituation
+from src.supplier.models.domain import (
+    DomAttachmentType,
+    DomBusinessSector,
+    DomCategory,
+    DomClassification,
+    DomCompanySize,
+    DomCustomerType,
+    DomIcmsTaxpayer,
+    DomIncomeType,
+    DomIssRegime,
+    DomIssWithholding,
+    DomPayerType,
+    DomPaymentMethod,
+    DomPixType,
+    DomPublicEntity,
+    DomRiskLevel,
+    DomSupplierSituation,
+    DomTaxationMethod,
+    DomTaxationRegime,
+    DomTaxpayerClassification,
+    DomTypeSupplier,
+    DomWithholdingTax,
+)
 from src.supplier.models.responsibility_matrix import ResponsibilityMatrix
 from src.supplier.models.supplier import Supplier, SupplierSituation
 
+CONTRACT_EXECUTION_MONITORING_FIELDS = tuple(
+    field.name
+    for field in ResponsibilityMatrix._meta.get_fields()
+    if field.name.startswith("contract_execution_monitoring_")
+)
 
+
+@pytest.mark.usesstorage
 class TestSupplierSignals(TestCase):
-    def setUp(self):
-        self.supplier = baker.make(
+    uses_domain_rows = True
+
+    @classmethod
+    def _dom(cls, model):
+        """Return the session-seeded reference row for a Dom* model."""
+        return next(iter(cls.domain_rows[model].values()))
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.supplier = baker.make(
             Supplier,
             address=baker.make("shared.Address"),
             contact=baker.make("shared.Contact"),
@@ -25,10 +63,27 @@ class TestSupplierSignals(TestCase):
             fiscal_details=baker.make("supplier.FiscalDetails"),
             company_information=baker.make("supplier.CompanyInformation"),
             contract=baker.make("supplier.Contract"),
-            classification=baker.make("supplier.DomClassification"),
-            category=baker.make("supplier.DomCategory"),
-            risk_level=baker.make("supplier.DomRiskLevel"),
-            type=baker.make("supplier.DomTypeSupplier"),
+            classification=cls._dom(DomClassification),
+            category=cls._dom(DomCategory),
+            risk_level=cls._dom(DomRiskLevel),
+            type=cls._dom(DomTypeSupplier),
+        )
+        cls.matrix_pending_status = DomSupplierSituation.objects.get(
+            name="PENDENTE",
+            pendency_type_id=DomPendecyTypeEnum.PENDENCIA_MATRIZ_RESPONSABILIDADE.value,
+        )
+        cls.documentation_pending_status = DomSupplierSituation.objects.get(
+            name="PENDENTE",
+            pendency_type_id=DomPendecyTypeEnum.PENDENCIA_DOCUMENTACAO.value,
+        )
+
+    def _current_situation(self) -> SupplierSituation:
+        """Load the latest situation with its status and pendency type in one query."""
+        return (
+            SupplierSituation.objects.select_related("status__pendency_type")
+            .filter(supplier=self.supplier)
+            .order_by("-created_at")
+            .first()
         )
 
     def _setup_address(self, supplier):
@@ -68,9 +123,9 @@ class TestSupplierSignals(TestCase):
         pd.bank_code = "001"
         pd.agency = "0001"
         if pd.payment_method is None:
-            pd.payment_method = baker.make("supplier.DomPaymentMethod")
+            pd.payment_method = self._dom(DomPaymentMethod)
         if pd.pix_key_type is None:
-            pd.pix_key_type = baker.make("supplier.DomPixType")
+            pd.pix_key_type = self._dom(DomPixType)
         pd.pix_key = "chavepix"
         pd.save()
 
@@ -86,15 +141,13 @@ class TestSupplierSignals(TestCase):
         org.responsible_executive = "Executivo"
         org.responsible_manager = "Gestor"
         if org.payer_type is None:
-            org.payer_type = baker.make("supplier.DomPayerType")
+            org.payer_type = self._dom(DomPayerType)
         if org.business_sector is None:
-            org.business_sector = baker.make("supplier.DomBusinessSector")
+            org.business_sector = self._dom(DomBusinessSector)
         if org.taxpayer_classification is None:
-            org.taxpayer_classification = baker.make(
-                "supplier.DomTaxpayerClassification"
-            )
+            org.taxpayer_classification = self._dom(DomTaxpayerClassification)
         if org.public_entity is None:
-            org.public_entity = baker.make("supplier.DomPublicEntity")
+            org.public_entity = self._dom(DomPublicEntity)
         org.save()
 
     def _setup_fiscal_details(self, supplier: Supplier):
@@ -103,14 +156,14 @@ class TestSupplierSignals(TestCase):
             supplier.save()
         fiscal = supplier.fiscal_details
         if fiscal.iss_withholding is None:
-            fiscal.iss_withholding = baker.make("supplier.DomIssWithholding")
+            fiscal.iss_withholding = self._dom(DomIssWithholding)
         if fiscal.iss_regime is None:
-            fiscal.iss_regime = baker.make("supplier.DomIssRegime")
+            fiscal.iss_regime = self._dom(DomIssRegime)
         fiscal.iss_taxpayer = True
         fiscal.simples_nacional_participant = True
         fiscal.cooperative_member = True
         if fiscal.withholding_tax_nature is None:
-            fiscal.withholding_tax_nature = baker.make("supplier.DomWithholdingTax")
+            fiscal.withholding_tax_nature = self._dom(DomWithholdingTax)
         fiscal.save()
 
     def _setup_company_information(self, supplier: Supplier):
@@ -119,17 +172,17 @@ class TestSupplierSignals(TestCase):
             supplier.save()
         ci = supplier.company_information
         if ci.company_size is None:
-            ci.company_size = baker.make("supplier.DomCompanySize")
+            ci.company_size = self._dom(DomCompanySize)
         if ci.icms_taxpayer is None:
-            ci.icms_taxpayer = baker.make("supplier.DomIcmsTaxpayer")
+            ci.icms_taxpayer = self._dom(DomIcmsTaxpayer)
         if ci.taxation_regime is None:
-            ci.taxation_regime = baker.make("supplier.DomTaxationRegime")
+            ci.taxation_regime = self._dom(DomTaxationRegime)
         if ci.income_type is None:
-            ci.income_type = baker.make("supplier.DomIncomeType")
+            ci.income_type = self._dom(DomIncomeType)
         if ci.taxation_method is None:
-            ci.taxation_method = baker.make("supplier.DomTaxationMethod")
+            ci.taxation_method = self._dom(DomTaxationMethod)
         if ci.customer_type is None:
-            ci.customer_type = baker.make("supplier.DomCustomerType")
+            ci.customer_type = self._dom(DomCustomerType)
         ci.nit = "123456789"
         ci.save()
 
@@ -154,13 +207,10 @@ class TestSupplierSignals(TestCase):
 
     def _setup_responsibility_matrix(self, supplier: Supplier):
         if not ResponsibilityMatrix.objects.filter(supplier=supplier).exists():
-            matrix = ResponsibilityMatrix.objects.create(supplier=supplier)
-            for field in matrix._meta.get_fields():
-                if hasattr(field, "name") and field.name.startswith(
-                    "contract_execution_monitoring_"
-                ):
-                    setattr(matrix, field.name, "R")
-            matrix.save()
+            ResponsibilityMatrix.objects.create(
+                supplier=supplier,
+                **dict.fromkeys(CONTRACT_EXECUTION_MONITORING_FIELDS, "R"),
+            )
 
     def _setup_attachment(self, supplier: Supplier):
         if not SupplierAttachment.objects.filter(supplier=supplier).exists():
@@ -178,13 +228,11 @@ class TestSupplierSignals(TestCase):
     def test_supplier_pendency_signal_sets_pendency_when_incomplete(self):
         self.supplier.trade_name = ""
         self.supplier.save()
-        self.supplier.refresh_from_db()
-        assert self.supplier.situation is not None
-        assert self.supplier.situation.status.name == "PENDENTE"
-        assert self.supplier.situation.status.pendency_type is not None
-        assert (
-            self.supplier.situation.status.pendency_type.name == "PENDÊNCIA DE CADASTRO"
-        )
+        situation = self._current_situation()
+        assert situation is not None
+        assert situation.status.name == "PENDENTE"
+        assert situation.status.pendency_type is not None
+        assert situation.status.pendency_type.name == "PENDÊNCIA DE CADASTRO"
 
     def test_supplier_pendency_signal_does_not_set_pendency_when_complete(self):
         self.supplier.trade_name = "Fornecedor Completo"
@@ -201,59 +249,45 @@ class TestSupplierSignals(TestCase):
         self._setup_responsibility_matrix(self.supplier)
         self._setup_attachment(self.supplier)
 
-        self.supplier.classification = self.supplier.classification or baker.make(
-            "supplier.DomClassification"
-        )
-        self.supplier.category = self.supplier.category or baker.make(
-            "supplier.DomCategory"
-        )
-        self.supplier.risk_level = self.supplier.risk_level or baker.make(
-            "supplier.DomRiskLevel"
-        )
-        self.supplier.type = self.supplier.type or baker.make(
-            "supplier.DomTypeSupplier"
+        self.supplier.classification = self.supplier.classification or self._dom(
+            DomClassification
         )
+        self.supplier.category = self.supplier.category or self._dom(DomCategory)
+        self.supplier.risk_level = self.supplier.risk_level or self._dom(DomRiskLevel)
+        self.supplier.type = self.supplier.type or self._dom(DomTypeSupplier)
         self.supplier.save()
-        self.supplier.refresh_from_db()
-        self.assertIsNotNone(self.supplier.situation)
-        self.assertIsNotNone(self.supplier.situation.status)
-        self.assertEqual(self.supplier.situation.status.name, "ATIVO")
-        self.assertIsNone(self.supplier.situation.status.pendency_type)
+        situation = self._current_situation()
+        self.assertIsNotNone(situation)
+        self.assertIsNotNone(situation.status)
+        self.assertEqual(situation.status.name, "ATIVO")
+        self.assertIsNone(situation.status.pendency_type)
 
     def test_supplier_pendency_signal_sets_pendency_when_matrix_incomplete(self):
         SupplierSituation.objects.filter(supplier=self.supplier).delete()
         SupplierSituation.objects.create(
-            supplier=self.supplier,
-            status=DomSupplierSituation.objects.get(
-                name="PENDENTE",
-                pendency_type_id=DomPendecyTypeEnum.PENDENCIA_MATRIZ_RESPONSABILIDADE.value,
-            ),
+            supplier=self.supplier, status=self.matrix_pending_status
         )
 
-        self.supplier.refresh_from_db()
-        self.assertIsNotNone(self.supplier.situation)
-        self.assertEqual(self.supplier.situation.status.name, "PENDENTE")
-        self.assertIsNotNone(self.supplier.situation.status.pendency_type)
+        situation = self._current_situation()
+        self.assertIsNotNone(situation)
+        self.assertEqual(situation.status.name, "PENDENTE")
+        self.assertIsNotNone(situation.status.pendency_type)
         self.assertEqual(
-            self.supplier.situation.status.pendency_type.name,
+            situation.status.pendency_type.name,
             "PENDÊNCIA MATRIZ DE RESPONSABILIDADE",
         )
 
     def test_supplier_pendency_signal_sets_pendency_when_attachments_incomplete(self):
         SupplierSituation.objects.filter(supplier=self.supplier).delete()
         SupplierSituation.objects.create(
-            supplier=self.supplier,
-            status=DomSupplierSituation.objects.get(
-                name="PENDENTE",
-                pendency_type_id=DomPendecyTypeEnum.PENDENCIA_DOCUMENTACAO.value,
-            ),
+            supplier=self.supplier, status=self.documentation_pending_status
         )
 
-        self.supplier.refresh_from_db()
-        self.assertIsNotNone(self.supplier.situation)
-        self.assertEqual(self.supplier.situation.status.name, "PENDENTE")
-        self.assertIsNotNone(self.supplier.situation.status.pendency_type)
+        situation = self._current_situation()
+        self.assertIsNotNone(situation)
+        self.assertEqual(situation.status.name, "PENDENTE")
+        self.assertIsNotNone(situation.status.pendency_type)
         self.assertEqual(
-            self.supplier.situation.status.pendency_type.name,
+            situation.status.pendency_type.name,
             "PENDÊNCIA DE DOCUMENTAÇÃO",
         )
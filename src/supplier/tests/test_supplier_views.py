@@ -286,6 +286,7 @@ def test_create_supplier_without_approval_steps_returns_validation_error():
 
 
 @pytest.mark.django_db
+@pytest.mark.usesstorage
 def test_attachment_list_returns_attachment_type_id_for_frontend_mapping():
     """
     Attachment list response should include attachmentTypeId for deterministic mapping on edit.
@@ -322,6 +323,7 @@ def test_attachment_list_returns_attachment_type_id_for_frontend_mapping():
 
 
 @pytest.mark.django_db
+@pytest.mark.usesstorage
 def test_attachment_history_view_returns_previous_versions_for_type():
     supplier = baker.make(
         Supplier,